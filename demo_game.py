@@ -18,7 +18,7 @@ def demo_simple_game():
 
     print(f"Player hand: {result.player_hand}")
     print(f"Dealer hand: {result.dealer_hand}")
-    print(f"Outcome: {result.outcome.value}")
+    print(f"Outcome: {result.outcome.name.lower()}")
     print(f"Payout: {result.payout:+.2f} (bet: {result.bet})")
     print()
 
@@ -40,7 +40,7 @@ def demo_multiple_hands():
         print(f"\nHand {i+1}:")
         print(f"  Player: {result.player_hand}")
         print(f"  Dealer: {result.dealer_hand}")
-        print(f"  Result: {result.outcome.value} ({result.payout:+.2f})")
+        print(f"  Result: {result.outcome.name.lower()} ({result.payout:+.2f})")
 
         if result.payout > 0:
             wins += 1
@@ -70,7 +70,7 @@ def demo_basic_strategy():
 
     print(f"Player final hand: {result.player_hand}")
     print(f"Dealer final hand: {result.dealer_hand}")
-    print(f"Outcome: {result.outcome.value}")
+    print(f"Outcome: {result.outcome.name.lower()}")
     print(f"Payout: {result.payout:+.2f}")
     print()
 
@@ -96,7 +96,7 @@ def demo_doubling_down():
     print(f"Player final hand: {result.player_hand}")
     print(f"Dealer final hand: {result.dealer_hand}")
     print(f"Bet: {result.bet} (doubled: {result.bet == 2.0})")
-    print(f"Outcome: {result.outcome.value}")
+    print(f"Outcome: {result.outcome.name.lower()}")
     print(f"Payout: {result.payout:+.2f}")
     print()
 
@@ -128,7 +128,7 @@ def demo_surrender():
 
     print(f"Player hand: {result.player_hand}")
     print(f"Dealer upcard: {game.dealer.upcard()}")
-    print(f"Outcome: {result.outcome.value}")
+    print(f"Outcome: {result.outcome.name.lower()}")
     print(f"Payout: {result.payout:+.2f} (surrendered: {result.payout == -0.5})")
     print()
 
@@ -145,7 +145,7 @@ def demo_different_rules():
     result1 = game1.play_hand()
     print(f"  Player: {result1.player_hand}")
     print(f"  Dealer: {result1.dealer_hand}")
-    print(f"  Outcome: {result1.outcome.value}")
+    print(f"  Outcome: {result1.outcome.name.lower()}")
 
     # House-favorable rules (dealer hits soft 17, 6:5 blackjack)
     print("\nHouse-favorable rules (H17, 6:5 BJ):")
@@ -157,7 +157,7 @@ def demo_different_rules():
     result2 = game2.play_hand()
     print(f"  Player: {result2.player_hand}")
     print(f"  Dealer: {result2.dealer_hand}")
-    print(f"  Outcome: {result2.outcome.value}")
+    print(f"  Outcome: {result2.outcome.name.lower()}")
     print()
 
 
@@ -192,7 +192,7 @@ def demo_blackjack_scenarios():
             print(" ← BUST!", end="")
         print()
 
-        print(f"  Winner: {result.outcome.value} ({result.payout:+.2f})")
+        print(f"  Winner: {result.outcome.name.lower()} ({result.payout:+.2f})")
 
     print()
 
@@ -36,14 +36,14 @@ def demo_strategy_lookups():
     hand1.add_card(Card('K', '♠'))
     hand1.add_card(Card('6', '♥'))
     action1 = basic.get_action(hand1, dealer_upcard, can_surrender=True)
-    print(f"Hard 16 vs dealer 10: {action1.value}")
+    print(f"Hard 16 vs dealer 10: {action1.name.lower()}")
 
     # Hard 11 vs 10
     hand2 = Hand()
     hand2.add_card(Card('6', '♠'))
     hand2.add_card(Card('5', '♥'))
     action2 = basic.get_action(hand2, dealer_upcard, can_double=True)
-    print(f"Hard 11 vs dealer 10: {action2.value}")
+    print(f"Hard 11 vs dealer 10: {action2.name.lower()}")
 
     # Soft 18 vs 9
     hand3 = Hand()
@@ -51,7 +51,7 @@ def demo_strategy_lookups():
     hand3.add_card(Card('7', '♥'))
     dealer_9 = Card('9', '♦')
     action3 = basic.get_action(hand3, dealer_9)
-    print(f"Soft 18 vs dealer 9: {action3.value}")
+    print(f"Soft 18 vs dealer 9: {action3.name.lower()}")
 
     # Pair of 8s vs 5
     hand4 = Hand()
@@ -59,7 +59,7 @@ def demo_strategy_lookups():
     hand4.add_card(Card('8', '♥'))
     dealer_5 = Card('5', '♦')
     action4 = basic.get_action(hand4, dealer_5, can_split=True)
-    print(f"Pair of 8s vs dealer 5: {action4.value}")
+    print(f"Pair of 8s vs dealer 5: {action4.name.lower()}")
     print()
 
 
@@ -76,10 +76,10 @@ def demo_strategy_fallbacks():
     dealer_upcard = Card('6', '♦')
 
     action_double = basic.get_action(hand, dealer_upcard, can_double=True)
-    print(f"Hard 11 vs 6 (can double): {action_double.value}")
+    print(f"Hard 11 vs 6 (can double): {action_double.name.lower()}")
 
     action_no_double = basic.get_action(hand, dealer_upcard, can_double=False)
-    print(f"Hard 11 vs 6 (can't double): {action_no_double.value}")
+    print(f"Hard 11 vs 6 (can't double): {action_no_double.name.lower()}")
 
     # Hard 16 - surrender if allowed, else hit
     hand2 = Hand()
@@ -88,10 +88,10 @@ def demo_strategy_fallbacks():
     dealer_10 = Card('10', '♦')
 
     action_surrender = basic.get_action(hand2, dealer_10, can_surrender=True)
-    print(f"Hard 16 vs 10 (can surrender): {action_surrender.value}")
+    print(f"Hard 16 vs 10 (can surrender): {action_surrender.name.lower()}")
 
     action_no_surrender = basic.get_action(hand2, dealer_10, can_surrender=False)
-    print(f"Hard 16 vs 10 (can't surrender): {action_no_surrender.value}")
+    print(f"Hard 16 vs 10 (can't surrender): {action_no_surrender.name.lower()}")
     print()
 
 
@@ -112,8 +112,8 @@ def demo_strategy_vs_strategy():
     never_bust_action = never_bust.get_action(hand, dealer_2)
 
     print(f"Hard 12 vs dealer 2:")
-    print(f"  Basic strategy: {basic_action.value}")
-    print(f"  Never bust: {never_bust_action.value}")
+    print(f"  Basic strategy: {basic_action.name.lower()}")
+    print(f"  Never bust: {never_bust_action.name.lower()}")
 
     # Hard 16 vs dealer 7
     hand2 = Hand()
@@ -125,8 +125,8 @@ def demo_strategy_vs_strategy():
     never_bust_action2 = never_bust.get_action(hand2, dealer_7)
 
     print(f"\nHard 16 vs dealer 7:")
-    print(f"  Basic strategy: {basic_action2.value}")
-    print(f"  Never bust: {never_bust_action2.value}")
+    print(f"  Basic strategy: {basic_action2.name.lower()}")
+    print(f"  Never bust: {never_bust_action2.name.lower()}")
     print()
 
 
@@ -161,7 +161,7 @@ def demo_play_with_strategy():
 
     print(f"Player hand: {result.player_hand}")
     print(f"Dealer hand: {result.dealer_hand}")
-    print(f"Outcome: {result.outcome.value}")
+    print(f"Outcome: {result.outcome.name.lower()}")
     print(f"Payout: {result.payout:+.2f}")
     print()
 
@@ -194,9 +194,9 @@ def demo_multiple_hands_with_strategy():
         game = BlackjackGame(shoe, rules=rules)
         result = game.play_hand(strategy_func=strategy_func)
         total_payout += result.payout
-        outcomes.append(result.outcome.value)
+        outcomes.append(result.outcome.name.lower())
 
-        print(f"Hand {i+1}: {result.outcome.value:20s} ({result.payout:+.2f})")
+        print(f"Hand {i+1}: {result.outcome.name.lower():20s} ({result.payout:+.2f})")
 
     print(f"\nTotal payout: {total_payout:+.2f}")
     print(f"Average: {total_payout / 10:+.4f} per hand")
@@ -81,7 +81,7 @@ def main():
                 penetration=PENETRATION
             )
             t0 = time.perf_counter()
-            result = sim.run_simulation(hand_count, strategy_func, num_sessions=1)
+            result = sim.run_simulation(hand_count, strategy_func, num_sessions=1, pause_gc=True)
             elapsed = time.perf_counter() - t0
 
             ev = result.ev_per_hand
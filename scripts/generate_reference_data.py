@@ -136,7 +136,7 @@ def run_simulation(strategy_path, config, total_hands):
     )
 
     t0 = time.perf_counter()
-    result = sim.run_simulation(total_hands, strategy_func, num_sessions=1)
+    result = sim.run_simulation(total_hands, strategy_func, num_sessions=1, pause_gc=True)
     elapsed = time.perf_counter() - t0
 
     return {
@@ -35,6 +35,11 @@ class BettingStrategy:
         """Load a betting strategy from a JSON config file."""
         with open(path, 'r') as f:
             data = json.load(f)
+        return BettingStrategy.from_dict(data)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'BettingStrategy':
+        """Build a betting strategy from a parsed config ({'type': ..., 'params': {...}})."""
         strategy_type = data.get('type', 'flat')
         params = data.get('params', {})
         cls = STRATEGY_REGISTRY.get(strategy_type, FlatBetting)
@@ -8,14 +8,17 @@ Classes:
 """
 
 import random
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+# Cards drawn per RNG call in infinite mode (dealt from a buffer in between)
+_INFINITE_DRAW_BATCH = 1024
 
 
 class Card:
     """Represents a single playing card."""
 
-    RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-    SUITS = ['♠', '♥', '♦', '♣']
+    RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+    SUITS = ('♠', '♥', '♦', '♣')
     _RANK_VALUES = {
         '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
         '10': 10, 'J': 10, 'Q': 10, 'K': 10, 'A': 11,
@@ -29,7 +32,7 @@ class Card:
     _VALID_RANKS = frozenset(RANKS)
     _VALID_SUITS = frozenset(SUITS)
 
-    __slots__ = ('rank', 'suit', '_value', '_hi_lo_value', 'is_ace')
+    __slots__ = ('rank', 'suit', '_value', '_hard_value', '_hi_lo_value', 'is_ace')
 
     def __init__(self, rank: str, suit: str):
         """
@@ -47,6 +50,7 @@ class Card:
         self.rank = rank
         self.suit = suit
         self._value = self._RANK_VALUES[rank]
+        self._hard_value = 1 if rank == 'A' else self._value  # Ace counted as 1
         self._hi_lo_value = self._HI_LO_VALUES[rank]
         self.is_ace = rank == 'A'
 
@@ -79,6 +83,11 @@ class Card:
         return self.rank == other.rank and self.suit == other.suit
 
 
+# One card per rank and suit, suit-major. Cards are never mutated, so decks
+# and shoes share these objects instead of constructing their own.
+_FULL_DECK: Tuple[Card, ...] = tuple(Card(rank, suit) for suit in Card.SUITS for rank in Card.RANKS)
+
+
 class Deck:
     """Represents a standard 52-card deck."""
 
@@ -89,7 +98,7 @@ class Deck:
 
     def _build_deck(self):
         """Build a standard 52-card deck."""
-        self.cards = [Card(rank, suit) for suit in Card.SUITS for rank in Card.RANKS]
+        self.cards = list(_FULL_DECK)
 
     def shuffle(self):
         """Shuffle the deck in place."""
@@ -132,18 +141,16 @@ class Shoe:
         self.penetration = penetration
         self.infinite = infinite
 
-        # Build card objects once and reuse them across reshuffles
-        self._master_cards: List[Card] = []
-        for suit in Card.SUITS:
-            for rank in Card.RANKS:
-                card = Card(rank, suit)
-                for _ in range(num_decks):
-                    self._master_cards.append(card)
+        # Reuse the shared card objects across decks and reshuffles
+        self._master_cards: List[Card] = [
+            card for card in _FULL_DECK for _ in range(num_decks)
+        ]
 
         self.total_cards = len(self._master_cards)
         self._shuffle_threshold = int(self.total_cards * self.penetration)
         self.cards: List[Card] = self._master_cards.copy()
         self._deck_template: List[Card] = self._master_cards  # For infinite mode
+        self._draw_buffer: List[Card] = []  # Pre-drawn infinite-mode cards
         self.cards_dealt = 0
         self.running_count = 0  # Hi-Lo running count
 
@@ -174,10 +181,12 @@ class Shoe:
             ValueError: If the shoe is empty (shouldn't happen with proper penetration)
         """
         if self.infinite:
-            # Infinite deck: sample with replacement from template
-            card = random.choice(self._deck_template)
-            # Don't track count for infinite deck (meaningless)
-            return card
+            # Infinite deck: sample with replacement from template, drawing a
+            # batch per RNG call. Don't track count for infinite deck (meaningless)
+            buffer = self._draw_buffer
+            if not buffer:
+                buffer.extend(random.choices(self._deck_template, k=_INFINITE_DRAW_BATCH))
+            return buffer.pop()
         else:
             # Check if we need to reshuffle before dealing
             if self.cards_dealt >= self._shuffle_threshold:
@@ -53,7 +53,7 @@ class Dealer:
         """
         if len(self.hand) < 1:
             raise ValueError("Dealer has no cards")
-        return self.hand.cards[0]
+        return self.hand.card(0)
 
     def holecard(self) -> Card:
         """
@@ -67,7 +67,7 @@ class Dealer:
         """
         if len(self.hand) < 2:
             raise ValueError("Dealer has fewer than 2 cards")
-        return self.hand.cards[1]
+        return self.hand.card(1)
 
     def should_hit(self) -> bool:
         """
@@ -7,31 +7,109 @@ Classes:
     BlackjackGame: Manages a single hand of blackjack
 """
 
+from array import array
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 from src.cards import Shoe
 from src.hand import Hand
 from src.dealer import Dealer
 
 
-class PlayerAction(Enum):
-    """Possible player actions."""
-    HIT = "hit"
-    STAND = "stand"
-    DOUBLE = "double"
-    SPLIT = "split"
-    SURRENDER = "surrender"
+class PlayerAction(IntEnum):
+    """
+    Possible player actions.
+
+    IntEnum so members compare as plain ints; strategy functions may
+    return either a member or its int value.
+    """
+    HIT = 0
+    STAND = 1
+    DOUBLE = 2
+    SPLIT = 3
+    SURRENDER = 4
 
 
-class HandOutcome(Enum):
+class HandOutcome(IntEnum):
     """Possible outcomes for a hand."""
-    PLAYER_WIN = "player_win"
-    DEALER_WIN = "dealer_win"
-    PUSH = "push"
-    PLAYER_BLACKJACK = "player_blackjack"
-    PLAYER_BUST = "player_bust"
-    DEALER_BUST = "dealer_bust"
+    PLAYER_WIN = 0
+    DEALER_WIN = 1
+    PUSH = 2
+    PLAYER_BLACKJACK = 3
+    PLAYER_BUST = 4
+    DEALER_BUST = 5
+
+
+# Plain int action codes for hot-path comparisons (avoid enum attribute lookups)
+HIT = 0
+STAND = 1
+DOUBLE = 2
+SPLIT = 3
+SURRENDER = 4
+
+# Bits for GameResult.actions_mask (one per action code)
+HIT_BIT = 1 << HIT
+STAND_BIT = 1 << STAND
+DOUBLE_BIT = 1 << DOUBLE
+SPLIT_BIT = 1 << SPLIT
+SURRENDER_BIT = 1 << SURRENDER
+
+# Maximum number of hands a player can hold after splitting
+MAX_SPLIT_HANDS = 4
+
+# Action names indexed by action code, used to decode recorded actions
+_ACTION_NAMES = ('hit', 'stand', 'double', 'split', 'surrender')
+
+# Per-hand action prefixes for split hands (indexed by hand position)
+_HAND_PREFIXES = tuple(f"hand_{i}:" for i in range(MAX_SPLIT_HANDS))
+
+
+def _build_outcome_table():
+    """
+    Precompute (outcome, payout multiplier) for every non-bust player total
+    against every dealer total.
+
+    Indexed as table[player_value][dealer_value]; dealer totals above 21 are
+    dealer busts. Blackjack payouts are applied separately since they depend
+    on the rules and on whether the hand came from a split.
+    """
+    table = []
+    for player_value in range(22):
+        row = []
+        for dealer_value in range(32):
+            if dealer_value > 21:
+                row.append((HandOutcome.DEALER_BUST, 1.0))
+            elif player_value > dealer_value:
+                row.append((HandOutcome.PLAYER_WIN, 1.0))
+            elif player_value < dealer_value:
+                row.append((HandOutcome.DEALER_WIN, -1.0))
+            else:
+                row.append((HandOutcome.PUSH, 0.0))
+        table.append(row)
+    return table
+
+
+_OUTCOME_TABLE = _build_outcome_table()
+
+
+def _final_state(hand: Hand, action_names: list) -> dict:
+    """
+    Summarize a finished player hand for GameResult.split_hands_final.
+
+    Args:
+        hand: The finished hand
+        action_names: Actions taken on the hand
+
+    Returns:
+        Dict with the hand's cards, value, soft/bust flags and actions
+    """
+    return {
+        'cards': [f"{c.rank}{c.suit[0]}" for c in hand.cards],
+        'value': hand.value(),
+        'soft': hand.is_soft(),
+        'bust': hand.is_bust(),
+        'actions': action_names
+    }
 
 
 @dataclass
@@ -51,11 +129,13 @@ class GameRules:
     blackjack_payout: float = 1.5  # 3:2 payout
 
 
-@dataclass
 class GameResult:
     """
     Result of a single blackjack hand.
 
+    A plain __slots__ class rather than a dataclass: one is created per hand,
+    so optional list fields stay None instead of allocating empty lists.
+
     Attributes:
         outcome: The outcome of the hand
         player_hand: Final player hand
@@ -64,34 +144,64 @@ class GameResult:
         bet: Original bet amount (total across all split hands)
         initial_player_hand: Initial 2-card hand (for strategy verification)
         initial_dealer_upcard: Dealer's upcard (for strategy verification)
-        actions: List of actions taken during the hand (for debugging)
+        actions: List of actions taken during the hand, or None if none recorded
         split_hands_count: Number of hands created (1 if no split, 2+ if split)
-        split_bets: List of individual hand bets (for debugging splits)
-        split_payouts: List of individual hand payouts (for debugging splits)
+        split_bets: List of individual hand bets (for debugging splits), or None
+        split_payouts: List of individual hand payouts (for debugging splits), or None
+        split_hands_final: Final state dict for each hand, or None if not captured
+        actions_mask: Bitmask of actions taken on any hand (HIT_BIT, DOUBLE_BIT, ...)
+        player_stats: (value, soft, blackjack, bust) of the player hand, set by snapshot()
+        dealer_stats: (value, soft, blackjack, bust) of the dealer hand, set by snapshot()
     """
-    outcome: HandOutcome
-    player_hand: Hand
-    dealer_hand: Hand
-    payout: float
-    bet: float = 1.0
-    initial_player_hand: Optional[Hand] = None
-    initial_dealer_upcard: Optional[int] = None
-    actions: list = None
-    split_hands_count: int = 1
-    split_bets: list = None
-    split_payouts: list = None
-    split_hands_final: list = None  # List of (cards, value, soft) tuples for each split hand
-
-    def __post_init__(self):
-        """Initialize lists if not provided."""
-        if self.actions is None:
-            self.actions = []
-        if self.split_bets is None:
-            self.split_bets = []
-        if self.split_payouts is None:
-            self.split_payouts = []
-        if self.split_hands_final is None:
-            self.split_hands_final = []
+
+    __slots__ = (
+        'outcome', 'player_hand', 'dealer_hand', 'payout', 'bet',
+        'initial_player_hand', 'initial_dealer_upcard', 'actions',
+        'split_hands_count', 'split_bets', 'split_payouts', 'split_hands_final',
+        'actions_mask', 'player_stats', 'dealer_stats'
+    )
+
+    def __init__(
+        self,
+        outcome: HandOutcome,
+        player_hand: Hand,
+        dealer_hand: Hand,
+        payout: float,
+        bet: float = 1.0,
+        initial_player_hand: Optional[Hand] = None,
+        initial_dealer_upcard: Optional[str] = None,
+        actions: Optional[list] = None,
+        split_hands_count: int = 1,
+        split_bets: Optional[list] = None,
+        split_payouts: Optional[list] = None,
+        split_hands_final: Optional[list] = None,
+        actions_mask: int = 0
+    ):
+        self.outcome = outcome
+        self.player_hand = player_hand
+        self.dealer_hand = dealer_hand
+        self.payout = payout
+        self.bet = bet
+        self.initial_player_hand = initial_player_hand
+        self.initial_dealer_upcard = initial_dealer_upcard
+        self.actions = actions
+        self.split_hands_count = split_hands_count
+        self.split_bets = split_bets
+        self.split_payouts = split_payouts
+        self.split_hands_final = split_hands_final
+        self.actions_mask = actions_mask
+        self.player_stats = None
+        self.dealer_stats = None
+
+    def snapshot(self):
+        """Record player and dealer hand summaries for later export."""
+        self.player_stats = self.player_hand.stats()
+        self.dealer_stats = self.dealer_hand.stats()
+
+    def __repr__(self) -> str:
+        """String representation of the result."""
+        return (f"GameResult(outcome={self.outcome!r}, payout={self.payout}, "
+                f"bet={self.bet}, split_hands_count={self.split_hands_count})")
 
 
 class BlackjackGame:
@@ -115,6 +225,57 @@ class BlackjackGame:
         self.dealer = Dealer(hits_soft_17=self.rules.dealer_hits_soft_17)
         self.player_hand = Hand()
         self.bet = bet
+        # Reusable Hand objects for split hands (grown on demand; recycled only
+        # by reset(), so results from a play_hand without reset keep their hands)
+        self._hand_pool = []
+        self._pool_used = 0
+        # Per-hand split state as parallel arrays, one slot per possible hand
+        # (actions are bytearrays of action codes)
+        self._split_hands = [None] * MAX_SPLIT_HANDS
+        self._split_bets = array('d', [0.0] * MAX_SPLIT_HANDS)
+        self._split_complete = bytearray(MAX_SPLIT_HANDS)
+        self._split_aces = bytearray(MAX_SPLIT_HANDS)
+        self._split_received = bytearray(MAX_SPLIT_HANDS)
+        self._split_bust = bytearray(MAX_SPLIT_HANDS)
+        self._split_actions = [None] * MAX_SPLIT_HANDS
+
+    def reset(self, bet: float = 1.0, new_hands: bool = False):
+        """
+        Prepare the game for another hand from the same shoe.
+
+        Args:
+            bet: Base bet amount for the next hand
+            new_hands: If True, replace the player, dealer and split hands with
+                       fresh objects instead of clearing them (use when an earlier
+                       GameResult that references them is being kept)
+        """
+        self.bet = bet
+        self._pool_used = 0  # Recycle split hands from the previous play
+        if new_hands:
+            self.player_hand = Hand()
+            self.dealer.hand = Hand()
+            self._hand_pool = []
+        else:
+            self.player_hand.clear()
+            self.dealer.hand.clear()
+
+    def _acquire_hand(self) -> Hand:
+        """
+        Take an empty Hand from the pool, creating one if the pool is exhausted.
+
+        Returns:
+            A cleared Hand owned by this game until the next reset() call
+        """
+        pool = self._hand_pool
+        used = self._pool_used
+        if used == len(pool):
+            hand = Hand()
+            pool.append(hand)
+        else:
+            hand = pool[used]
+            hand.clear()
+        self._pool_used = used + 1
+        return hand
 
     def deal_initial_cards(self):
         """Deal initial two cards to player and dealer."""
@@ -127,99 +288,146 @@ class BlackjackGame:
         self.player_hand.add_card(self.shoe.deal_card())
         self.dealer.hand.add_card(self.shoe.deal_card())
 
-    def play_hand(self, strategy_func=None, deal_cards=True) -> GameResult:
+    def play_hand(self, strategy_func=None, deal_cards=True, capture_state=True) -> GameResult:
         """
         Play a complete hand of blackjack.
 
         Args:
             strategy_func: Optional function that takes (player_hand, dealer_upcard)
-                         and returns a PlayerAction. If None, player stands.
+                         and returns a PlayerAction (or its int code; plain ints
+                         are fastest). If None, player stands.
             deal_cards: If True, deal initial cards. Set False if cards already dealt.
+            capture_state: If True (default), record the initial hand, dealer upcard,
+                         per-hand final states and hand-indexed actions (for
+                         display/export). Simulation loops pass False: those are
+                         then left empty and actions is a flat list.
 
         Returns:
             GameResult with outcome and payout
         """
         if deal_cards:
             self.deal_initial_cards()
+        if self._pool_used:
+            # Split hands from the previous play weren't released by reset() and
+            # may still be referenced by its result: start a fresh pool
+            self._hand_pool = []
+            self._pool_used = 0
+
+        # Bind frequently used attributes to locals for the hot path
+        bet = self.bet
+        rules = self.rules
+        surrender_allowed = rules.surrender_allowed
+        double_after_split = rules.double_after_split
+        player_hand = self.player_hand
+        dealer = self.dealer
+        dealer_hand = dealer.hand
+        deal_card = self.shoe.deal_card
+
+        dealer_upcard = dealer.upcard()
 
         # Capture initial hand state (for strategy verification)
-        initial_hand = Hand()
-        for card in self.player_hand.cards[:2]:  # Copy first 2 cards
-            initial_hand.add_card(card)
-        initial_dealer_upcard = self.dealer.upcard().rank  # Store just the rank, not the whole card
-        actions = []
+        if capture_state:
+            initial_hand = Hand.from_cards(player_hand.cards[:2])  # Copy first 2 cards
+            initial_dealer_upcard = dealer_upcard.rank  # Store just the rank, not the whole card
+        else:
+            initial_hand = None
+            initial_dealer_upcard = None
 
         # Check for dealer blackjack
-        if self.dealer.has_blackjack():
-            if self.player_hand.is_blackjack():
+        if dealer.has_blackjack():
+            if player_hand.is_blackjack():
                 # Push - both have blackjack
                 return GameResult(
                     outcome=HandOutcome.PUSH,
-                    player_hand=self.player_hand,
-                    dealer_hand=self.dealer.hand,
+                    player_hand=player_hand,
+                    dealer_hand=dealer_hand,
                     payout=0.0,
-                    bet=self.bet,
+                    bet=bet,
                     initial_player_hand=initial_hand,
-                    initial_dealer_upcard=initial_dealer_upcard,
-                    actions=actions
+                    initial_dealer_upcard=initial_dealer_upcard
                 )
             else:
                 # Dealer wins with blackjack
                 return GameResult(
                     outcome=HandOutcome.DEALER_WIN,
-                    player_hand=self.player_hand,
-                    dealer_hand=self.dealer.hand,
-                    payout=-self.bet,
-                    bet=self.bet,
+                    player_hand=player_hand,
+                    dealer_hand=dealer_hand,
+                    payout=-bet,
+                    bet=bet,
                     initial_player_hand=initial_hand,
-                    initial_dealer_upcard=initial_dealer_upcard,
-                    actions=actions
+                    initial_dealer_upcard=initial_dealer_upcard
                 )
 
         # Check for player blackjack (dealer doesn't have blackjack)
-        if self.player_hand.is_blackjack():
+        if player_hand.is_blackjack():
             return GameResult(
                 outcome=HandOutcome.PLAYER_BLACKJACK,
-                player_hand=self.player_hand,
-                dealer_hand=self.dealer.hand,
-                payout=self.bet * self.rules.blackjack_payout,
-                bet=self.bet,
+                player_hand=player_hand,
+                dealer_hand=dealer_hand,
+                payout=bet * rules.blackjack_payout,
+                bet=bet,
+                initial_player_hand=initial_hand,
+                initial_dealer_upcard=initial_dealer_upcard
+            )
+
+        # No strategy: player stands on the initial hand, so no action loop or splits
+        if strategy_func is None:
+            dealer.play_hand(self.shoe)
+            outcome, payout = self._evaluate_hand(player_hand, bet, dealer_hand.value())
+            return GameResult(
+                outcome=outcome,
+                player_hand=player_hand,
+                dealer_hand=dealer_hand,
+                payout=payout,
+                bet=bet,
                 initial_player_hand=initial_hand,
                 initial_dealer_upcard=initial_dealer_upcard,
-                actions=actions
+                actions=['stand'],
+                split_hands_count=1,
+                split_bets=[bet],
+                split_payouts=[payout],
+                split_hands_final=[_final_state(player_hand, ['stand'])] if capture_state else None,
+                actions_mask=STAND_BIT
             )
 
-        # Initialize split hands structure
-        # Each entry tracks: hand, bet, whether it's complete, if it's split aces, and actions for this hand
-        split_hands = [{
-            'hand': self.player_hand,
-            'bet': self.bet,
-            'is_complete': False,
-            'is_aces': False,
-            'actions': []
-        }]
+        # Split hands are kept in parallel fixed-size arrays owned by the game
+        # (at most MAX_SPLIT_HANDS); slot 0 starts as the dealt hand
+        hands = self._split_hands
+        bets = self._split_bets
+        complete = self._split_complete
+        aces = self._split_aces
+        received = self._split_received
+        busted = self._split_bust
+        split_actions = self._split_actions
+        hands[0] = player_hand
+        bets[0] = bet
+        complete[0] = 0
+        aces[0] = 0
+        received[0] = 1
+        busted[0] = 0
+        split_actions[0] = bytearray()
+        num_hands = 1
 
         # Player's turn - process each hand (including splits)
         hand_idx = 0
-        while hand_idx < len(split_hands):
-            hand_dict = split_hands[hand_idx]
-            current_hand = hand_dict['hand']
-
+        while hand_idx < num_hands:
             # Skip if hand is already complete
-            if hand_dict['is_complete']:
+            if complete[hand_idx]:
                 hand_idx += 1
                 continue
 
+            current_hand = hands[hand_idx]
+            hand_actions = split_actions[hand_idx]
+
             # Special handling for split hands that haven't received their second card yet
-            # Check explicitly for False (not just falsy) to avoid affecting the original hand
-            if hand_dict.get('received_card') == False:
+            if not received[hand_idx]:
                 # Deal one card to complete the initial 2-card hand
-                current_hand.add_card(self.shoe.deal_card())
-                hand_dict['received_card'] = True
+                current_hand.add_card(deal_card())
+                received[hand_idx] = 1
 
                 # For split aces, mark complete (no further actions allowed)
-                if hand_dict['is_aces']:
-                    hand_dict['is_complete'] = True
+                if aces[hand_idx]:
+                    complete[hand_idx] = 1
                     hand_idx += 1
                     continue
                 # For non-aces, fall through to normal action loop
@@ -227,177 +435,196 @@ class BlackjackGame:
             # Normal action loop for this hand
             while True:
                 if current_hand.is_bust():
-                    hand_dict['is_complete'] = True
+                    complete[hand_idx] = 1
+                    busted[hand_idx] = 1
                     break
 
-                # Get action from strategy (or default to stand)
-                if strategy_func:
-                    action = strategy_func(current_hand, self.dealer.upcard())
-                else:
-                    action = PlayerAction.STAND
+                # Get action from strategy
+                action = strategy_func(current_hand, dealer_upcard)
 
-                # Handle SPLIT action
-                if action == PlayerAction.SPLIT:
+                # Handle actions and record what actually happened
+                # (ordered by how often strategies return them)
+                if action == STAND:
+                    hand_actions.append(STAND)
+                    complete[hand_idx] = 1
+                    break
+                elif action == HIT:
+                    hand_actions.append(HIT)
+                    current_hand.add_card(deal_card())
+                elif action == DOUBLE:
+                    # Double down: double bet, take one card, end turn
+                    if len(current_hand) == 2 and (double_after_split or hand_idx == 0):
+                        hand_actions.append(DOUBLE)
+                        bets[hand_idx] *= 2
+                        current_hand.add_card(deal_card())
+                        complete[hand_idx] = 1
+                        break
+                    else:
+                        # Double not allowed, treat as hit
+                        hand_actions.append(HIT)
+                        current_hand.add_card(deal_card())
+                elif action == SPLIT:
                     # Verify split is allowed (is pair, has 2 cards, not exceeded max hands)
-                    if current_hand.is_pair() and len(current_hand.cards) == 2 and len(split_hands) < 4:
+                    if current_hand.is_pair() and len(current_hand) == 2 and num_hands < MAX_SPLIT_HANDS:
                         # Get the two cards
-                        card1 = current_hand.cards[0]
-                        card2 = current_hand.cards[1]
+                        card1 = current_hand.card(0)
+                        card2 = current_hand.card(1)
 
                         # Check if splitting aces
                         is_aces = (card1.rank == 'A')
 
                         # Create two new hands
-                        hand1 = Hand()
+                        hand1 = self._acquire_hand()
                         hand1.add_card(card1)
-                        hand1.add_card(self.shoe.deal_card())
+                        hand1.add_card(deal_card())
 
-                        hand2 = Hand()
+                        hand2 = self._acquire_hand()
                         hand2.add_card(card2)
                         # Second hand will receive its card when we iterate to it
 
+                        # Shift later hands right to open the slot after this one
+                        for k in range(num_hands, hand_idx + 1, -1):
+                            hands[k] = hands[k - 1]
+                            bets[k] = bets[k - 1]
+                            complete[k] = complete[k - 1]
+                            aces[k] = aces[k - 1]
+                            received[k] = received[k - 1]
+                            busted[k] = busted[k - 1]
+                            split_actions[k] = split_actions[k - 1]
+                        num_hands += 1
+
                         # Replace current hand with first split hand
-                        split_hands[hand_idx] = {
-                            'hand': hand1,
-                            'bet': self.bet,
-                            'is_complete': is_aces,  # Aces are complete after one card
-                            'is_aces': is_aces,
-                            'received_card': True,  # First hand already got its second card
-                            'actions': ['split']  # Record that this hand came from a split
-                        }
-
-                        # Insert second split hand after current
-                        split_hands.insert(hand_idx + 1, {
-                            'hand': hand2,
-                            'bet': self.bet,
-                            'is_complete': False,
-                            'is_aces': is_aces,
-                            'received_card': False,  # Will get card when we iterate to it
-                            'actions': ['split']  # Record that this hand came from a split
-                        })
+                        # (aces are complete after one card; both record the split)
+                        hands[hand_idx] = hand1
+                        complete[hand_idx] = is_aces
+                        aces[hand_idx] = is_aces
+                        received[hand_idx] = 1
+                        split_actions[hand_idx] = bytearray((SPLIT,))
+
+                        # Second split hand goes after current
+                        # (it receives its second card when we iterate to it)
+                        nxt = hand_idx + 1
+                        hands[nxt] = hand2
+                        bets[nxt] = bet
+                        complete[nxt] = 0
+                        aces[nxt] = is_aces
+                        received[nxt] = 0
+                        busted[nxt] = 0
+                        split_actions[nxt] = bytearray((SPLIT,))
 
                         # For aces, break (both hands complete after one card)
                         # For other pairs, update current_hand and continue playing first split hand
                         if is_aces:
                             break
                         else:
-                            # Update current_hand to the first split hand and continue action loop
+                            # Continue the action loop on the first split hand
                             current_hand = hand1
-                            hand_dict = split_hands[hand_idx]  # Update dict reference to new split hand
-                            continue  # Continue to next iteration of action loop
+                            hand_actions = split_actions[hand_idx]
+                            continue
                     else:
                         # Split not allowed, treat as stand
-                        hand_dict['actions'].append('stand')
-                        hand_dict['is_complete'] = True
+                        hand_actions.append(STAND)
+                        complete[hand_idx] = 1
                         break
-
-                # Handle actions and record what actually happened
-                if action == PlayerAction.HIT:
-                    hand_dict['actions'].append('hit')
-                    current_hand.add_card(self.shoe.deal_card())
-                elif action == PlayerAction.STAND:
-                    hand_dict['actions'].append('stand')
-                    hand_dict['is_complete'] = True
-                    break
-                elif action == PlayerAction.DOUBLE:
-                    # Double down: double bet, take one card, end turn
-                    if len(current_hand.cards) == 2 and (self.rules.double_after_split or hand_idx == 0):
-                        hand_dict['actions'].append('double')
-                        hand_dict['bet'] *= 2
-                        current_hand.add_card(self.shoe.deal_card())
-                        hand_dict['is_complete'] = True
-                        break
-                    else:
-                        # Double not allowed, treat as hit
-                        hand_dict['actions'].append('hit')
-                        current_hand.add_card(self.shoe.deal_card())
-                elif action == PlayerAction.SURRENDER:
+                elif action == SURRENDER:
                     # Surrender only allowed on first hand before split
-                    if self.rules.surrender_allowed and hand_idx == 0 and len(split_hands) == 1:
+                    if surrender_allowed and hand_idx == 0 and num_hands == 1:
                         # Surrender: lose half bet
                         return GameResult(
                             outcome=HandOutcome.DEALER_WIN,
                             player_hand=current_hand,
-                            dealer_hand=self.dealer.hand,
-                            payout=-hand_dict['bet'] * 0.5,
-                            bet=hand_dict['bet'],
+                            dealer_hand=dealer_hand,
+                            payout=-bets[0] * 0.5,
+                            bet=bets[0],
                             initial_player_hand=initial_hand,
                             initial_dealer_upcard=initial_dealer_upcard,
-                            actions=['surrender']
+                            actions=['surrender'],
+                            actions_mask=SURRENDER_BIT
                         )
                     else:
                         # Surrender not allowed, treat as stand
-                        hand_dict['actions'].append('stand')
-                        hand_dict['is_complete'] = True
+                        hand_actions.append(STAND)
+                        complete[hand_idx] = 1
                         break
                 else:
                     # Unknown action, treat as stand
-                    hand_dict['actions'].append('stand')
-                    hand_dict['is_complete'] = True
+                    hand_actions.append(STAND)
+                    complete[hand_idx] = 1
                     break
 
             # Move to next hand
             hand_idx += 1
 
         # Dealer's turn (plays once for all hands)
-        self.dealer.play_hand(self.shoe)
+        dealer.play_hand(self.shoe)
 
         # Aggregate results from all split hands
         total_bet = 0.0
         total_payout = 0.0
         split_bets = []
         split_payouts = []
-        split_hands_final = []
+        split_hands_final = [] if capture_state else None
         all_actions = []
+        actions_mask = 0
         primary_outcome = None
 
-        for idx, hand_dict in enumerate(split_hands):
-            hand = hand_dict['hand']
-            bet = hand_dict['bet']
+        is_split = num_hands > 1  # Any split hand pays 1:1 for 21
+        dealer_value = dealer_hand.value()  # Same for every hand (bust if > 21)
 
-            # Determine outcome for this hand
-            is_split = (len(split_hands) > 1)  # Any split hand pays 1:1 for 21
-            outcome, payout = self._evaluate_hand(hand, bet, is_split=is_split)
+        for idx in range(num_hands):
+            hand = hands[idx]
+            hand_bet = bets[idx]
+            hand_actions = split_actions[idx]
+
+            # Determine outcome for this hand (busts already known from the action loop)
+            if busted[idx]:
+                outcome, payout = HandOutcome.PLAYER_BUST, -hand_bet
+            else:
+                outcome, payout = self._evaluate_hand(hand, hand_bet, dealer_value, is_split)
 
             # Track first hand's outcome as primary
             if idx == 0:
                 primary_outcome = outcome
 
-            total_bet += bet
+            total_bet += hand_bet
             total_payout += payout
-            split_bets.append(bet)
+            split_bets.append(hand_bet)
             split_payouts.append(payout)
 
+            # Decode action codes to names (names are shared constants)
+            action_names = [_ACTION_NAMES[code] for code in hand_actions]
+            for code in hand_actions:
+                actions_mask |= 1 << code
+            if not capture_state:
+                all_actions.extend(action_names)
+                continue
+
             # Store final state of each hand
-            split_hands_final.append({
-                'cards': [f"{c.rank}{c.suit[0]}" for c in hand.cards],
-                'value': hand.value(),
-                'soft': hand.is_soft(),
-                'bust': hand.is_bust(),
-                'actions': hand_dict['actions']
-            })
+            split_hands_final.append(_final_state(hand, action_names))
 
             # Collect actions with hand index (if multiple hands)
-            if len(split_hands) > 1:
-                for action in hand_dict['actions']:
-                    all_actions.append(f"hand_{idx}:{action}")
+            if is_split:
+                prefix = _HAND_PREFIXES[idx]
+                for action in action_names:
+                    all_actions.append(prefix + action)
             else:
-                all_actions.extend(hand_dict['actions'])
+                all_actions.extend(action_names)
 
         # Create single GameResult with aggregated data
         return GameResult(
             outcome=primary_outcome,
-            player_hand=split_hands[0]['hand'],  # Primary hand for display
-            dealer_hand=self.dealer.hand,
+            player_hand=hands[0],  # Primary hand for display
+            dealer_hand=dealer_hand,
             payout=total_payout,
             bet=total_bet,
             initial_player_hand=initial_hand,
             initial_dealer_upcard=initial_dealer_upcard,
             actions=all_actions,
-            split_hands_count=len(split_hands),
+            split_hands_count=num_hands,
             split_bets=split_bets,
             split_payouts=split_payouts,
-            split_hands_final=split_hands_final
+            split_hands_final=split_hands_final,
+            actions_mask=actions_mask
         )
 
     def _determine_winner(self, initial_hand: Hand, initial_dealer_upcard: int, actions: list) -> GameResult:
@@ -459,42 +686,30 @@ class BlackjackGame:
                 actions=actions
             )
 
-    def _evaluate_hand(self, hand: Hand, bet: float, is_split: bool = False) -> tuple[HandOutcome, float]:
+    def _evaluate_hand(self, hand: Hand, bet: float, dealer_value: int,
+                       is_split: bool = False) -> tuple[HandOutcome, float]:
         """
         Evaluate a single hand against the dealer.
 
         Args:
             hand: The player's hand to evaluate
             bet: The bet amount for this hand
+            dealer_value: Dealer's final total (computed once for all split hands;
+                          totals over 21 are dealer busts)
             is_split: True if this is a split hand (affects blackjack payout)
 
         Returns:
             Tuple of (outcome, payout)
         """
+        player_value = hand.value()
+
         # Player busted
-        if hand.is_bust():
+        if player_value > 21:
             return (HandOutcome.PLAYER_BUST, -bet)
 
-        player_value = hand.value()
-        dealer_value = self.dealer.value()
-
-        # Dealer busted
-        if self.dealer.is_bust():
-            # Check for blackjack (but not if split - 21 after split pays 1:1)
-            if hand.is_blackjack() and not is_split:
-                return (HandOutcome.PLAYER_BLACKJACK, bet * self.rules.blackjack_payout)
-            else:
-                return (HandOutcome.DEALER_BUST, bet)
+        outcome, multiplier = _OUTCOME_TABLE[player_value][dealer_value]
 
-        # Compare values
-        if player_value > dealer_value:
-            # Check for blackjack (but not if split)
-            if hand.is_blackjack() and not is_split:
-                return (HandOutcome.PLAYER_BLACKJACK, bet * self.rules.blackjack_payout)
-            else:
-                return (HandOutcome.PLAYER_WIN, bet)
-        elif player_value < dealer_value:
-            return (HandOutcome.DEALER_WIN, -bet)
-        else:
-            # Push
-            return (HandOutcome.PUSH, 0.0)
+        # Winning blackjack pays the rules' payout (but not after a split - 21 pays 1:1)
+        if multiplier > 0 and not is_split and hand.is_blackjack():
+            return (HandOutcome.PLAYER_BLACKJACK, bet * self.rules.blackjack_payout)
+        return (outcome, bet * multiplier)
@@ -5,7 +5,7 @@ Classes:
     Hand: Represents a player or dealer hand with value calculation
 """
 
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 from src.cards import Card
 
 
@@ -19,43 +19,85 @@ class Hand:
     - Detecting pairs, blackjack, and busts
     """
 
+    # Initial card slots; covers every realistic hand, grows on demand
+    _CAPACITY = 12
+
+    __slots__ = ('_cards', '_n', '_hard_total', '_aces', '_soft_bonus', '_total')
+
     def __init__(self):
         """Initialize an empty hand."""
-        self.cards: List[Card] = []
-        self._cached_value: int = 0
-        self._cached_soft: bool = False
-        self._dirty: bool = False
-
-    def add_card(self, card: Card):
+        self._cards: List[Optional[Card]] = [None] * self._CAPACITY
+        self._n: int = 0
+        # Running totals, updated as cards are added
+        self._hard_total: int = 0  # Every ace counted as 1
+        self._aces: int = 0  # Number of aces in the hand
+        self._soft_bonus: int = 0  # 10 if one ace can count as 11, else 0
+        self._total: int = 0  # Best total (_hard_total + _soft_bonus)
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[Card]) -> 'Hand':
         """
-        Add a card to the hand.
+        Build a hand holding the given cards, in order.
 
         Args:
-            card: The card to add
+            cards: Cards to add
+
+        Returns:
+            A new hand
+        """
+        hand = cls()
+        add_card = hand.add_card
+        for card in cards:
+            add_card(card)
+        return hand
+
+    @property
+    def cards(self) -> Tuple[Card, ...]:
+        """Cards currently in the hand (a read-only snapshot; use add_card to add)."""
+        return tuple(self._cards[:self._n])
+
+    def card(self, index: int) -> Card:
         """
-        self.cards.append(card)
-        self._dirty = True
+        Get one card without copying the hand.
 
-    def _recalculate(self):
-        """Recalculate cached value and soft flag."""
-        total = 0
-        aces = 0
+        Args:
+            index: Position of the card (0 = first card dealt)
 
-        for card in self.cards:
-            if card.is_ace:
-                aces += 1
-                total += 11
-            else:
-                total += card._value
+        Returns:
+            The card at that position
 
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
+        Raises:
+            IndexError: If the hand has no card at that position
+        """
+        if not 0 <= index < self._n:
+            raise IndexError("hand card index out of range")
+        return self._cards[index]
 
-        self._cached_value = total
-        # Hand is soft if at least one ace is still counted as 11
-        self._cached_soft = aces > 0
-        self._dirty = False
+    def add_card(self, card: Card):
+        """
+        Add a card to the hand.
+
+        Updates the running total in O(1); no rescan of earlier cards.
+
+        Args:
+            card: The card to add
+        """
+        n = self._n
+        if n == len(self._cards):
+            self._cards.extend([None] * self._CAPACITY)
+        self._cards[n] = card
+        self._n = n + 1
+
+        hard = self._hard_total + card._hard_value
+        aces = self._aces + card.is_ace
+        self._hard_total = hard
+        self._aces = aces
+
+        # At most one ace can ever count as 11, so the best total is the hard
+        # total plus 10 when an ace is present and that doesn't bust
+        soft_bonus = 10 if aces and hard <= 11 else 0
+        self._soft_bonus = soft_bonus
+        self._total = hard + soft_bonus
 
     def value(self) -> int:
         """
@@ -64,9 +106,7 @@ class Hand:
         Returns:
             The highest value <= 21, or lowest value if all bust
         """
-        if self._dirty:
-            self._recalculate()
-        return self._cached_value
+        return self._total
 
     def is_soft(self) -> bool:
         """
@@ -75,11 +115,7 @@ class Hand:
         Returns:
             True if hand contains an ace counted as 11
         """
-        if not self.cards:
-            return False
-        if self._dirty:
-            self._recalculate()
-        return self._cached_soft
+        return self._soft_bonus != 0
 
     def is_bust(self) -> bool:
         """
@@ -88,9 +124,7 @@ class Hand:
         Returns:
             True if hand value exceeds 21
         """
-        if self._dirty:
-            self._recalculate()
-        return self._cached_value > 21
+        return self._hard_total > 21
 
     def is_blackjack(self) -> bool:
         """
@@ -99,9 +133,18 @@ class Hand:
         Returns:
             True if hand is 21 with exactly 2 cards (ace + 10-value card)
         """
-        if len(self.cards) != 2:
-            return False
-        return self.value() == 21
+        return self._n == 2 and self._hard_total == 11 and self._soft_bonus == 10
+
+    def stats(self) -> tuple:
+        """
+        Snapshot the hand's summary values in one call.
+
+        Returns:
+            Tuple of (value, is_soft, is_blackjack, is_bust)
+        """
+        total = self._total
+        soft = self._soft_bonus != 0
+        return (total, soft, self._n == 2 and total == 21 and soft, self._hard_total > 21)
 
     def is_pair(self) -> bool:
         """
@@ -110,9 +153,10 @@ class Hand:
         Returns:
             True if hand has exactly 2 cards with the same rank
         """
-        if len(self.cards) != 2:
+        if self._n != 2:
             return False
-        return self.cards[0].rank == self.cards[1].rank
+        cards = self._cards
+        return cards[0].rank == cards[1].rank
 
     def can_split(self) -> bool:
         """
@@ -124,19 +168,20 @@ class Hand:
         return self.is_pair()
 
     def clear(self):
-        """Remove all cards from the hand."""
-        self.cards = []
-        self._cached_value = 0
-        self._cached_soft = False
-        self._dirty = False
+        """Remove all cards from the hand (slots are reused)."""
+        self._n = 0
+        self._hard_total = 0
+        self._aces = 0
+        self._soft_bonus = 0
+        self._total = 0
 
     def __len__(self) -> int:
         """Return the number of cards in the hand."""
-        return len(self.cards)
+        return self._n
 
     def __repr__(self) -> str:
         """String representation of the hand."""
-        if not self.cards:
+        if not self._n:
             return "Hand(empty)"
 
         cards_str = ", ".join(str(card) for card in self.cards)
@@ -5,6 +5,7 @@ Classes:
     Strategy: Loads and executes JSON-based blackjack strategies
 """
 
+import copy
 import json
 from pathlib import Path
 from typing import Optional
@@ -12,6 +13,21 @@ from src.game import PlayerAction
 from src.hand import Hand
 from src.cards import Card
 
+try:
+    import orjson  # Optional: faster strategy loading
+except ImportError:
+    orjson = None
+
+
+# Loaded strategies keyed by (resolved path, mtime_ns, size), so re-creating a
+# Strategy for an unchanged file skips JSON parsing and table building. Holds a
+# private copy of the parsed JSON (each instance gets its own deep copy, so
+# edits to rules or tables never leak between instances) and the immutable
+# resolved tables. Bounded because custom strategies are loaded from one-off
+# temp files.
+_LOAD_CACHE = {}
+_LOAD_CACHE_SIZE = 32
+
 
 class Strategy:
     """
@@ -36,8 +52,22 @@ class Strategy:
         Args:
             strategy_path: Path to the strategy JSON file
         """
-        with open(strategy_path, 'r') as f:
-            data = json.load(f)
+        # Reuse a previous load of the same unchanged file (parsed JSON + tables)
+        path = Path(strategy_path).resolve()
+        stat = path.stat()
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        cached = _LOAD_CACHE.get(cache_key)
+        if cached is not None:
+            data, tables = cached
+            data = copy.deepcopy(data)
+        else:
+            if orjson is not None:
+                with open(strategy_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(strategy_path, 'r') as f:
+                    data = json.load(f)
+            tables = None
 
         self.name = data.get('name', 'Unknown Strategy')
         self.description = data.get('description', '')
@@ -50,6 +80,77 @@ class Strategy:
         self.pairs = strategy_data.get('pairs', {})
         self.action_codes = data.get('action_codes', {})
 
+        if tables is None:
+            self._build_action_tables()
+            if len(_LOAD_CACHE) >= _LOAD_CACHE_SIZE:
+                del _LOAD_CACHE[next(iter(_LOAD_CACHE))]  # Evict the oldest entry
+            _LOAD_CACHE[cache_key] = (
+                copy.deepcopy(data), (self._hard_table, self._soft_table, self._pair_table)
+            )
+        else:
+            self._hard_table, self._soft_table, self._pair_table = tables
+
+    # Highest hand total get_action can see (hard 21 plus a ten-value card)
+    _MAX_TOTAL = 31
+
+    def _build_action_tables(self):
+        """
+        Resolve every table entry up front so get_action does no string work.
+
+        Tables are indexed as table[player_value][dealer_value][flags], where
+        dealer_value is the upcard's blackjack value (2-11, ace = 11) and
+        flags = can_double + 2 * can_surrender. Pair rows are indexed by the
+        value of one card of the pair and are None when the pair isn't listed.
+        """
+        dealer_keys = {v: ('A' if v == 11 else str(v)) for v in range(2, 12)}
+
+        def resolve_row(row, can_split):
+            # One entry per dealer value (0-1 unused), each with 4 flag combos
+            resolved = [None, None]
+            for dealer_value in range(2, 12):
+                action_str = row.get(dealer_keys[dealer_value], 'stand')
+                resolved.append(tuple(
+                    self._resolve_action(
+                        action_str,
+                        can_double=bool(flags & 1),
+                        can_surrender=bool(flags & 2),
+                        can_split=can_split
+                    )
+                    for flags in range(4)
+                ))
+            return tuple(resolved)
+
+        hard_table = []
+        for value in range(self._MAX_TOTAL + 1):
+            row = self.hard_totals.get(str(value))
+            if row is not None:
+                hard_table.append(resolve_row(row, can_split=False))
+            else:
+                # Default: stand if >= 17, otherwise hit
+                default = PlayerAction.STAND if value >= 17 else PlayerAction.HIT
+                hard_table.append(((default,) * 4,) * 12)
+
+        # Soft totals without their own row fall back to the hard row
+        soft_table = []
+        for value in range(self._MAX_TOTAL + 1):
+            row = self.soft_totals.get(str(value))
+            if row is not None:
+                soft_table.append(resolve_row(row, can_split=False))
+            else:
+                soft_table.append(hard_table[value])
+
+        # Pairs are only looked up when splitting is allowed
+        pair_table = [None] * 12
+        for card_value in range(2, 12):
+            row = self.pairs.get(dealer_keys[card_value])
+            if row is not None:
+                pair_table[card_value] = resolve_row(row, can_split=True)
+
+        # Tuples: cached loads share these tables between instances
+        self._hard_table = tuple(hard_table)
+        self._soft_table = tuple(soft_table)
+        self._pair_table = tuple(pair_table)
+
     def get_action(
         self,
         player_hand: Hand,
@@ -71,85 +172,18 @@ class Strategy:
         Returns:
             PlayerAction to take
         """
-        # Normalize dealer upcard (A, 2-10)
-        dealer_key = self._normalize_dealer_upcard(dealer_upcard)
+        dealer_value = dealer_upcard.value()
+        flags = (1 if can_double else 0) + (2 if can_surrender else 0)
 
         # Check for pairs first (if can split and hand is a pair)
-        if can_split and player_hand.is_pair() and len(player_hand) == 2:
-            pair_rank = self._normalize_pair_rank(player_hand.cards[0])
-            if pair_rank in self.pairs:
-                action_str = self.pairs[pair_rank].get(dealer_key, 'stand')
-                return self._resolve_action(
-                    action_str,
-                    can_double=can_double,
-                    can_surrender=can_surrender,
-                    can_split=can_split
-                )
-
-        # Check soft vs hard totals
-        hand_value = player_hand.value()
-
-        if player_hand.is_soft():
-            # Soft hand (has an ace counted as 11)
-            hand_key = str(hand_value)
-            if hand_key in self.soft_totals:
-                action_str = self.soft_totals[hand_key].get(dealer_key, 'stand')
-                return self._resolve_action(
-                    action_str,
-                    can_double=can_double,
-                    can_surrender=can_surrender,
-                    can_split=False  # Already checked pairs
-                )
-
-        # Hard hand (no soft ace)
-        hand_key = str(hand_value)
-        if hand_key in self.hard_totals:
-            action_str = self.hard_totals[hand_key].get(dealer_key, 'stand')
-            return self._resolve_action(
-                action_str,
-                can_double=can_double,
-                can_surrender=can_surrender,
-                can_split=False  # Already checked pairs
-            )
-
-        # Default: stand if >= 17, otherwise hit
-        if hand_value >= 17:
-            return PlayerAction.STAND
-        return PlayerAction.HIT
-
-    def _normalize_dealer_upcard(self, card: Card) -> str:
-        """
-        Normalize dealer upcard to strategy table key (2-10, A).
-
-        Args:
-            card: The dealer's upcard
-
-        Returns:
-            String key for strategy lookup
-        """
-        if card.rank == 'A':
-            return 'A'
-        elif card.rank in ['J', 'Q', 'K']:
-            return '10'
-        else:
-            return card.rank
-
-    def _normalize_pair_rank(self, card: Card) -> str:
-        """
-        Normalize card rank for pair lookup (2-10, A).
-
-        Args:
-            card: One card from the pair
-
-        Returns:
-            String key for pair lookup
-        """
-        if card.rank == 'A':
-            return 'A'
-        elif card.rank in ['J', 'Q', 'K']:
-            return '10'
-        else:
-            return card.rank
+        if can_split and len(player_hand) == 2 and player_hand.is_pair():
+            pair_row = self._pair_table[player_hand.card(0).value()]
+            if pair_row is not None:
+                return pair_row[dealer_value][flags]
+
+        # Soft hand (has an ace counted as 11) or hard hand
+        table = self._soft_table if player_hand.is_soft() else self._hard_table
+        return table[player_hand.value()][dealer_value][flags]
 
     def _resolve_action(
         self,
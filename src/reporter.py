@@ -16,6 +16,41 @@ from dataclasses import asdict
 from src.simulator import SimulationResult, SessionResult
 from src.game import GameResult
 
+try:
+    import orjson  # Optional: faster JSON export
+except ImportError:
+    orjson = None
+
+
+# Session and hand CSVs are written as preformatted lines rather than through
+# csv.writer: every field is a number, bool or enum name, so no quoting is
+# needed. Lines end in \r\n to match csv.writer's default output.
+_CSV_BUFFER = 1 << 20
+_SESSIONS_HEADER = (
+    'session_num,hands_played,total_payout,ev_per_hand,ev_percent,win_count,'
+    'loss_count,push_count,win_rate,blackjack_count,bust_count,surrender_count,'
+    'double_count\r\n'
+)
+_SESSION_LINE = '%d,%d,%.2f,%.6f,%.4f,%d,%d,%d,%.6f,%d,%d,%d,%d\r\n'
+_HANDS_HEADER = (
+    'hand_num,outcome,player_value,player_soft,player_blackjack,player_bust,'
+    'dealer_value,dealer_soft,dealer_blackjack,dealer_bust,bet,payout\r\n'
+)
+_HAND_LINE = '%d,%s,%d,%s,%s,%s,%d,%s,%s,%s,%.2f,%.2f\r\n'
+
+
+def _ensure_parent_dir(filepath: str) -> None:
+    """
+    Create the parent directory of filepath if it doesn't exist.
+
+    Checked on every export (one stat call) so a directory removed between
+    exports is recreated.
+
+    Args:
+        filepath: Path of the file about to be written
+    """
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+
 
 def export_summary_csv(result: SimulationResult, filepath: str) -> None:
     """
@@ -25,7 +60,8 @@ def export_summary_csv(result: SimulationResult, filepath: str) -> None:
         result: SimulationResult to export
         filepath: Path to output CSV file
     """
-    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(filepath)
+    num_sessions = result.session_count
 
     with open(filepath, 'w', newline='') as f:
         writer = csv.writer(f)
@@ -63,9 +99,9 @@ def export_summary_csv(result: SimulationResult, filepath: str) -> None:
             result.bust_count,
             result.surrender_count,
             result.double_count,
-            len(result.sessions),
-            f'{result.session_ev_mean:.6f}' if result.sessions else '',
-            f'{result.session_ev_stdev:.6f}' if len(result.sessions) > 1 else ''
+            num_sessions,
+            f'{result.session_ev_mean:.6f}' if num_sessions else '',
+            f'{result.session_ev_stdev:.6f}' if num_sessions > 1 else ''
         ])
 
 
@@ -80,45 +116,52 @@ def export_sessions_csv(result: SimulationResult, filepath: str) -> None:
     if not result.sessions:
         return
 
-    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    _write_sessions_csv(result.sessions, filepath, [s.ev_per_hand for s in result.sessions])
 
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.writer(f)
 
-        # Header
-        writer.writerow([
-            'session_num',
-            'hands_played',
-            'total_payout',
-            'ev_per_hand',
-            'ev_percent',
-            'win_count',
-            'loss_count',
-            'push_count',
-            'win_rate',
-            'blackjack_count',
-            'bust_count',
-            'surrender_count',
-            'double_count'
-        ])
+def _write_sessions_csv(sessions: List[SessionResult], filepath: str, session_evs: List[float]) -> None:
+    """
+    Write the per-session CSV using precomputed per-session EVs.
+
+    Args:
+        sessions: Sessions to export
+        filepath: Path to output CSV file
+        session_evs: ev_per_hand of each session, in session order
+    """
+    _ensure_parent_dir(filepath)
+
+    with open(filepath, 'w', newline='', buffering=_CSV_BUFFER) as f:
+        f.write(_SESSIONS_HEADER)
+        f.writelines(_session_lines(sessions, session_evs))
 
-        # Data rows
-        for i, session in enumerate(result.sessions, start=1):
-            writer.writerow([
-                i,
-                session.hands_played,
-                f'{session.total_payout:.2f}',
-                f'{session.ev_per_hand:.6f}',
-                f'{session.ev_per_hand * 100:.4f}',
-                session.win_count,
-                session.loss_count,
-                session.push_count,
-                f'{session.win_rate:.6f}',
-                session.blackjack_count,
-                session.bust_count,
-                session.surrender_count,
-                session.double_count
-            ])
+
+def _session_lines(sessions: List[SessionResult], session_evs: List[float]):
+    """
+    Yield one formatted CSV line per session, numbered from 1.
+
+    Args:
+        sessions: Sessions to convert
+        session_evs: ev_per_hand of each session, in session order
+
+    Yields:
+        CSV line matching the export_sessions_csv header
+    """
+    for i, (session, ev) in enumerate(zip(sessions, session_evs), start=1):
+        yield _SESSION_LINE % (
+            i,
+            session.hands_played,
+            session.total_payout,
+            ev,
+            ev * 100,
+            session.win_count,
+            session.loss_count,
+            session.push_count,
+            session.win_rate,
+            session.blackjack_count,
+            session.bust_count,
+            session.surrender_count,
+            session.double_count
+        )
 
 
 def export_hands_csv(result: SimulationResult, filepath: str) -> None:
@@ -137,43 +180,106 @@ def export_hands_csv(result: SimulationResult, filepath: str) -> None:
         return
 
     hands = result.sessions[0].hand_results
-    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(filepath)
 
-    with open(filepath, 'w', newline='') as f:
-        writer = csv.writer(f)
+    with open(filepath, 'w', newline='', buffering=_CSV_BUFFER) as f:
+        f.write(_HANDS_HEADER)
+        f.writelines(_hand_lines(hands))
 
-        # Header
-        writer.writerow([
-            'hand_num',
-            'outcome',
-            'player_value',
-            'player_soft',
-            'player_blackjack',
-            'player_bust',
-            'dealer_value',
-            'dealer_soft',
-            'dealer_blackjack',
-            'dealer_bust',
-            'bet',
-            'payout'
-        ])
 
-        # Data rows
-        for i, hand in enumerate(hands, start=1):
-            writer.writerow([
-                i,
-                hand.outcome.name,
-                hand.player_hand.value(),
-                hand.player_hand.is_soft(),
-                hand.player_hand.is_blackjack(),
-                hand.player_hand.is_bust(),
-                hand.dealer_hand.value(),
-                hand.dealer_hand.is_soft(),
-                hand.dealer_hand.is_blackjack(),
-                hand.dealer_hand.is_bust(),
-                f'{hand.bet:.2f}',
-                f'{hand.payout:.2f}'
-            ])
+def _hand_stats(hand: GameResult) -> tuple:
+    """
+    Get a hand result's player and dealer summaries, snapshotting on first use.
+
+    Shared by the CSV and JSON exporters so each hand is summarized once even
+    when both run on the same results.
+
+    Args:
+        hand: Hand result to summarize
+
+    Returns:
+        Tuple of (player_stats, dealer_stats), each (value, soft, blackjack, bust)
+    """
+    if hand.player_stats is None:
+        hand.snapshot()
+    return hand.player_stats, hand.dealer_stats
+
+
+def _hand_lines(hands: List[GameResult]):
+    """
+    Yield one formatted CSV line per hand result, numbered from 1.
+
+    Args:
+        hands: Hand results to convert
+
+    Yields:
+        CSV line matching the export_hands_csv header
+    """
+    for i, hand in enumerate(hands, start=1):
+        player, dealer = _hand_stats(hand)
+        yield _HAND_LINE % (i, hand.outcome.name, *player, *dealer, hand.bet, hand.payout)
+
+
+def _session_json(session_num: int, session: SessionResult, ev: float, include_hands: bool) -> dict:
+    """
+    Build the JSON record for one session.
+
+    Args:
+        session_num: 1-based session number
+        session: Session to convert
+        ev: The session's ev_per_hand (computed once by the caller)
+        include_hands: If True, include the session's tracked hand results
+
+    Returns:
+        Dict of session statistics, plus 'hands' when requested and available
+    """
+    session_data = {
+        'session_num': session_num,
+        'hands_played': session.hands_played,
+        'total_payout': round(session.total_payout, 2),
+        'ev_per_hand': round(ev, 6),
+        'ev_percent': round(ev * 100, 4),
+        'win_count': session.win_count,
+        'loss_count': session.loss_count,
+        'push_count': session.push_count,
+        'win_rate': round(session.win_rate, 6),
+        'blackjack_count': session.blackjack_count,
+        'bust_count': session.bust_count,
+        'surrender_count': session.surrender_count,
+        'double_count': session.double_count
+    }
+
+    # Include hand data if requested
+    if include_hands and session.hand_results:
+        session_data['hands'] = [_hand_json(hand) for hand in session.hand_results]
+
+    return session_data
+
+
+def _hand_json(hand: GameResult) -> dict:
+    """
+    Build the JSON record for one hand result.
+
+    Args:
+        hand: Hand result to convert
+
+    Returns:
+        Dict of outcome, player/dealer summary values, bet and payout
+    """
+    player, dealer = _hand_stats(hand)
+    player_value, player_soft, player_blackjack, _ = player
+    dealer_value, dealer_soft, dealer_blackjack, _ = dealer
+    return {
+        'outcome': hand.outcome.name,
+        'player_value': player_value,
+        'player_soft': player_soft,
+        'player_blackjack': player_blackjack,
+        'dealer_value': dealer_value,
+        'dealer_soft': dealer_soft,
+        'dealer_blackjack': dealer_blackjack,
+        'bet': round(hand.bet, 2),
+        'payout': round(hand.payout, 2)
+    }
 
 
 def export_all_csv(result: SimulationResult, base_path: str) -> dict:
@@ -225,7 +331,7 @@ def export_to_json(result: SimulationResult, filepath: str, include_hands: bool
         filepath: Path to output JSON file
         include_hands: If True, include individual hand results (can be large)
     """
-    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(filepath)
 
     # Build JSON structure
     data = {
@@ -248,48 +354,21 @@ def export_to_json(result: SimulationResult, filepath: str, include_hands: bool
 
     # Add session data
     for i, session in enumerate(result.sessions, start=1):
-        session_data = {
-            'session_num': i,
-            'hands_played': session.hands_played,
-            'total_payout': round(session.total_payout, 2),
-            'ev_per_hand': round(session.ev_per_hand, 6),
-            'ev_percent': round(session.ev_per_hand * 100, 4),
-            'win_count': session.win_count,
-            'loss_count': session.loss_count,
-            'push_count': session.push_count,
-            'win_rate': round(session.win_rate, 6),
-            'blackjack_count': session.blackjack_count,
-            'bust_count': session.bust_count,
-            'surrender_count': session.surrender_count,
-            'double_count': session.double_count
-        }
-
-        # Include hand data if requested
-        if include_hands and session.hand_results:
-            session_data['hands'] = [
-                {
-                    'outcome': hand.outcome.name,
-                    'player_value': hand.player_hand.value(),
-                    'player_soft': hand.player_hand.is_soft(),
-                    'player_blackjack': hand.player_hand.is_blackjack(),
-                    'dealer_value': hand.dealer_hand.value(),
-                    'dealer_soft': hand.dealer_hand.is_soft(),
-                    'dealer_blackjack': hand.dealer_hand.is_blackjack(),
-                    'bet': round(hand.bet, 2),
-                    'payout': round(hand.payout, 2)
-                }
-                for hand in session.hand_results
-            ]
-
-        data['sessions'].append(session_data)
+        data['sessions'].append(_session_json(i, session, session.ev_per_hand, include_hands))
 
     # Add session variance statistics if applicable
-    if len(result.sessions) > 1:
+    if result.session_count > 1:
         data['variance'] = {
             'session_ev_mean': round(result.session_ev_mean, 6),
             'session_ev_stdev': round(result.session_ev_stdev, 6)
         }
 
-    # Write to file
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Write to file. orjson (if installed) encodes much faster and gives
+    # equivalent JSON, not identical bytes: float formatting (1e-5 vs 1e-05)
+    # and the trailing newline can differ.
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w') as f:
+            f.write(json.dumps(data, indent=2))
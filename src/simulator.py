@@ -7,16 +7,64 @@ Classes:
     Simulator: Runs blackjack simulations with configurable parameters
 """
 
+import gc
+from math import fsum
 import time
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from array import array
 from dataclasses import dataclass, field
 from typing import Optional, Callable, List
-import statistics
+from src.betting import FlatBetting
 from src.cards import Shoe
 from src.game import BlackjackGame, GameRules, GameResult, HandOutcome, PlayerAction
+from src.game import DOUBLE_BIT, SURRENDER_BIT
 from src.hand import Hand
 from src.cards import Card
 
 
+def _welford(values, n: int = 0, mean: float = 0.0, m2: float = 0.0) -> tuple[int, float, float]:
+    """
+    Fold values into a running (count, mean, M2) Welford accumulator.
+
+    Args:
+        values: Iterable of numbers
+        n, mean, m2: State to continue from (defaults start empty)
+
+    Returns:
+        Updated (count, mean, M2)
+    """
+    for x in values:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return n, mean, m2
+
+
+def _finish_welford(n: int, mean: float, m2: float) -> tuple[float, float]:
+    """Turn Welford state into (mean, sample stdev); stdev is 0.0 below 2 values."""
+    if n < 2:
+        return mean, 0.0
+    return mean, (m2 / (n - 1)) ** 0.5
+
+
+def mean_stdev(values) -> tuple[float, float]:
+    """
+    Mean and sample standard deviation of values in one pass (Welford).
+
+    Plain float arithmetic: much faster than the statistics module, which
+    works in exact fractions, and accurate enough for per-session EVs.
+
+    Args:
+        values: Iterable of numbers
+
+    Returns:
+        (mean, stdev); mean is 0.0 when empty, stdev is 0.0 for fewer than 2 values
+    """
+    return _finish_welford(*_welford(values))
+
+
 @dataclass
 class SessionResult:
     """
@@ -94,6 +142,9 @@ class SimulationResult:
         split_count: Total splits
         max_win_streak: Longest winning streak across all sessions
         max_loss_streak: Longest losing streak across all sessions
+        elapsed_ns: Wall-clock run time in nanoseconds
+        session_ev_stats: (count, mean, M2) of session EVs, set instead of
+            sessions when a run does not retain its sessions
     """
     total_hands: int = 0
     total_payout: float = 0.0
@@ -107,7 +158,8 @@ class SimulationResult:
     surrender_count: int = 0
     double_count: int = 0
     split_count: int = 0
-    elapsed_seconds: float = 0.0
+    elapsed_ns: int = 0
+    session_ev_stats: Optional[tuple] = None
     max_win_streak: int = 0
     max_loss_streak: int = 0
 
@@ -133,19 +185,37 @@ class SimulationResult:
             return 0.0
         return self.win_count / total_decided
 
+    @property
+    def elapsed_seconds(self) -> float:
+        """Wall-clock run time in seconds."""
+        return self.elapsed_ns / 1e9
+
+    @property
+    def session_count(self) -> int:
+        """Number of sessions run (retained or not)."""
+        if self.session_ev_stats is not None:
+            return self.session_ev_stats[0]
+        return len(self.sessions)
+
+    def _session_ev_mean_stdev(self) -> tuple[float, float]:
+        """Mean and stdev of session EVs, from sessions or the folded stats."""
+        if self.session_ev_stats is not None:
+            return _finish_welford(*self.session_ev_stats)
+        return mean_stdev(s.ev_per_hand for s in self.sessions)
+
     @property
     def session_ev_mean(self) -> float:
         """Mean EV across sessions."""
-        if not self.sessions:
+        if not self.session_count:
             return self.ev_per_hand
-        return statistics.mean(s.ev_per_hand for s in self.sessions)
+        return self._session_ev_mean_stdev()[0]
 
     @property
     def session_ev_stdev(self) -> float:
         """Standard deviation of EV across sessions."""
-        if len(self.sessions) < 2:
+        if self.session_count < 2:
             return 0.0
-        return statistics.stdev(s.ev_per_hand for s in self.sessions)
+        return self._session_ev_mean_stdev()[1]
 
     def summary(self) -> str:
         """
@@ -184,17 +254,29 @@ class SimulationResult:
             f"  Longest loss streak: {self.max_loss_streak}",
         ]
 
-        if self.sessions:
+        if self.session_count:
+            ev_mean, ev_stdev = self._session_ev_mean_stdev()
             lines.extend([
                 f"",
-                f"Session statistics ({len(self.sessions)} sessions):",
-                f"  Mean EV: {self.session_ev_mean:+.6f}",
-                f"  StdDev: {self.session_ev_stdev:.6f}",
+                f"Session statistics ({self.session_count} sessions):",
+                f"  Mean EV: {ev_mean:+.6f}",
+                f"  StdDev: {ev_stdev:.6f}",
             ])
 
         return "\n".join(lines)
 
 
+# Counter fields summed (or maxed, for streaks) when aggregating sessions
+_SESSION_COUNTERS = attrgetter(
+    'hands_played', 'total_payout', 'total_wagered', 'win_count', 'loss_count',
+    'push_count', 'blackjack_count', 'bust_count', 'surrender_count',
+    'double_count', 'split_count', 'max_win_streak', 'max_loss_streak'
+)
+
+# Sessions folded into the totals per batch when they are not retained
+_FOLD_BATCH = 1000
+
+
 class Simulator:
     """
     Blackjack simulation engine.
@@ -224,6 +306,39 @@ class Simulator:
         self.penetration = penetration
         self.infinite_shoe = infinite_shoe
 
+    def simulate_batch(
+        self,
+        num_hands: int,
+        strategy_func: Callable[[Hand, Card], PlayerAction],
+        shoe: Optional[Shoe] = None
+    ) -> array:
+        """
+        Play flat-bet hands and return only their net payouts.
+
+        Lighter than run_session when only EV/variance is needed: one game is
+        reused for every hand and no statistics or hand results are kept.
+
+        Args:
+            num_hands: Number of hands to play
+            strategy_func: Strategy function (player_hand, dealer_upcard) -> PlayerAction
+            shoe: Optional shoe to use (creates new one if None)
+
+        Returns:
+            array('d') of net payouts, one per hand (in units of the bet)
+        """
+        if shoe is None:
+            shoe = Shoe(
+                num_decks=self.num_decks,
+                penetration=self.penetration,
+                infinite=self.infinite_shoe
+            )
+
+        play_hand = BlackjackGame(shoe, rules=self.rules).play_hand
+        payouts = array('d', bytes(8 * num_hands))  # Zero-filled doubles
+        for i in range(num_hands):
+            payouts[i] = play_hand(strategy_func, capture_state=False).payout
+        return payouts
+
     def run_session(
         self,
         num_hands: int,
@@ -259,72 +374,128 @@ class Simulator:
             if hasattr(betting_strategy, 'set_shoe'):
                 betting_strategy.set_shoe(shoe)
 
+        # Flat betting never changes its bet and ignores updates, so hoist the
+        # bet out of the loop and skip the per-hand calls
+        flat_bet = 1.0
+        if type(betting_strategy) is FlatBetting:
+            flat_bet = betting_strategy.base_unit
+            betting_strategy = None
+
         session = SessionResult()
+        hand_results = session.hand_results
+        rules = self.rules
+        player_blackjack = HandOutcome.PLAYER_BLACKJACK
+        player_bust = HandOutcome.PLAYER_BUST
+
+        # Counters live in locals for the duration of the loop and are
+        # written back to the session once at the end
+        total_payout = 0.0
+        payout_error = 0.0  # Kahan compensation for total_payout
+        total_wagered = 0.0
+        win_count = loss_count = push_count = 0
+        blackjack_count = bust_count = surrender_count = 0
+        double_count = split_count = 0
+        max_win_streak = max_loss_streak = 0
 
         # Streak tracking
         current_win_streak = 0
         current_loss_streak = 0
 
+        # One game is reused for every hand; after a hand is stored, the game
+        # gets fresh Hand objects so the stored result is not overwritten
+        game = BlackjackGame(shoe, rules=rules)
+        reset_game = game.reset
+        play_hand = game.play_hand
+        capture = False
+
+        # Number of hands still to store (0 when tracking is off)
+        to_track = max_tracked_hands if track_hands else 0
+
         for _ in range(num_hands):
             # Get bet from betting strategy
-            bet = betting_strategy.get_bet() if betting_strategy else 1.0
+            bet = betting_strategy.get_bet() if betting_strategy else flat_bet
 
-            game = BlackjackGame(shoe, rules=self.rules, bet=bet)
-            result = game.play_hand(strategy_func=strategy_func)
+            reset_game(bet, capture)
+
+            # Only hands that will be stored need their full state captured
+            capture = to_track > 0
+
+            result = play_hand(strategy_func=strategy_func, capture_state=capture)
+            payout = result.payout
+            outcome = result.outcome
 
             # Update betting strategy with outcome
             if betting_strategy:
-                if result.payout > 0:
-                    outcome = 'win'
-                elif result.payout < 0:
-                    outcome = 'loss'
+                if payout > 0:
+                    bet_outcome = 'win'
+                elif payout < 0:
+                    bet_outcome = 'loss'
                 else:
-                    outcome = 'push'
-                betting_strategy.update(outcome, result.payout, result.bet)
+                    bet_outcome = 'push'
+                betting_strategy.update(bet_outcome, payout, result.bet)
 
             # Update statistics
-            session.hands_played += 1
-            session.total_payout += result.payout
-            session.total_wagered += result.bet
+            # Kahan summation: payouts like 6:5 blackjacks are not exact in
+            # binary, and the rounding error builds up over long sessions
+            y = payout - payout_error
+            t = total_payout + y
+            payout_error = (t - total_payout) - y
+            total_payout = t
+            total_wagered += result.bet
 
             # Track outcomes and streaks
-            if result.payout > 0:
-                session.win_count += 1
+            if payout > 0:
+                win_count += 1
                 current_win_streak += 1
                 current_loss_streak = 0
-                if current_win_streak > session.max_win_streak:
-                    session.max_win_streak = current_win_streak
-            elif result.payout < 0:
-                session.loss_count += 1
+                if current_win_streak > max_win_streak:
+                    max_win_streak = current_win_streak
+            elif payout < 0:
+                loss_count += 1
                 current_loss_streak += 1
                 current_win_streak = 0
-                if current_loss_streak > session.max_loss_streak:
-                    session.max_loss_streak = current_loss_streak
+                if current_loss_streak > max_loss_streak:
+                    max_loss_streak = current_loss_streak
             else:
-                session.push_count += 1
+                push_count += 1
                 # Pushes don't break streaks (they're neutral)
 
             # Track special outcomes
-            if result.outcome == HandOutcome.PLAYER_BLACKJACK:
-                session.blackjack_count += 1
-            elif result.outcome == HandOutcome.PLAYER_BUST:
-                session.bust_count += 1
-
-            # Track surrenders (payout is half the bet)
-            if result.outcome == HandOutcome.DEALER_WIN and abs(result.payout) == bet * 0.5:
-                session.surrender_count += 1
-
-            # Track doubles (actions contain double)
-            if any('double' in action for action in result.actions):
-                session.double_count += 1
+            if outcome == player_blackjack:
+                blackjack_count += 1
+            elif outcome == player_bust:
+                bust_count += 1
+
+            # Track surrenders and doubles from the actions taken
+            mask = result.actions_mask
+            if mask & SURRENDER_BIT:
+                surrender_count += 1
+            if mask & DOUBLE_BIT:
+                double_count += 1
 
             # Track splits (split_hands_count > 1)
             if result.split_hands_count > 1:
-                session.split_count += 1
+                split_count += 1
 
             # Store hand result if tracking is enabled
-            if track_hands and len(session.hand_results) < max_tracked_hands:
-                session.hand_results.append(result)
+            if capture:
+                result.snapshot()
+                hand_results.append(result)
+                to_track -= 1
+
+        session.hands_played = num_hands
+        session.total_payout = total_payout
+        session.total_wagered = total_wagered
+        session.win_count = win_count
+        session.loss_count = loss_count
+        session.push_count = push_count
+        session.blackjack_count = blackjack_count
+        session.bust_count = bust_count
+        session.surrender_count = surrender_count
+        session.double_count = double_count
+        session.split_count = split_count
+        session.max_win_streak = max_win_streak
+        session.max_loss_streak = max_loss_streak
 
         return session
 
@@ -335,7 +506,9 @@ class Simulator:
         num_sessions: int = 1,
         betting_strategy=None,
         track_hands: bool = False,
-        max_tracked_hands: int = 100
+        max_tracked_hands: int = 100,
+        retain_sessions: bool = True,
+        pause_gc: bool = False
     ) -> SimulationResult:
         """
         Run a complete simulation.
@@ -352,60 +525,115 @@ class Simulator:
             betting_strategy: Optional BettingStrategy for variable bet sizing
             track_hands: If True, store sample of individual hand results for export
             max_tracked_hands: Maximum number of hands to track (default 100)
+            retain_sessions: If False, fold each session into the totals and the
+                             session EV statistics instead of keeping it in
+                             result.sessions (saves memory on very long runs).
+                             Cannot be combined with track_hands, since tracked
+                             hands are stored on the sessions.
+            pause_gc: If True, disable the cyclic garbage collector for the run.
+                      This changes process-wide state, so only single-run
+                      processes (CLI scripts) should use it, never a server
+                      handling concurrent runs, where one run could re-enable
+                      GC in the middle of another.
 
         Returns:
             SimulationResult with complete statistics
+
+        Raises:
+            ValueError: If track_hands is set without retain_sessions
         """
-        result = SimulationResult()
-        start_time = time.perf_counter()
-
-        if num_sessions == 1:
-            # Single session mode - one long session
-            session = self.run_session(
-                total_hands,
-                strategy_func,
-                betting_strategy=betting_strategy,
-                track_hands=track_hands,
-                max_tracked_hands=max_tracked_hands
-            )
-            result.sessions = [session]
-        else:
-            # Multi-session mode - divide hands across sessions
-            hands_per_session = total_hands // num_sessions
+        if track_hands and not retain_sessions:
+            raise ValueError("track_hands requires retain_sessions=True")
 
-            for _ in range(num_sessions):
+        result = SimulationResult()
+        if not retain_sessions:
+            result.session_ev_stats = (0, 0.0, 0.0)
+        start_ns = time.perf_counter_ns()
+
+        # Optionally pause the cyclic GC: a run allocates millions of short-lived
+        # hands and results that form no reference cycles, so collections are
+        # pure overhead
+        gc_was_enabled = pause_gc and gc.isenabled()
+        if pause_gc:
+            gc.disable()
+        try:
+            if num_sessions == 1:
+                # Single session mode - one long session
                 session = self.run_session(
-                    hands_per_session,
+                    total_hands,
                     strategy_func,
                     betting_strategy=betting_strategy,
                     track_hands=track_hands,
                     max_tracked_hands=max_tracked_hands
                 )
-                result.sessions.append(session)
-
-        result.elapsed_seconds = time.perf_counter() - start_time
-
-        # Aggregate results from all sessions
-        for session in result.sessions:
-            result.total_hands += session.hands_played
-            result.total_payout += session.total_payout
-            result.total_wagered += session.total_wagered
-            result.win_count += session.win_count
-            result.loss_count += session.loss_count
-            result.push_count += session.push_count
-            result.blackjack_count += session.blackjack_count
-            result.bust_count += session.bust_count
-            result.surrender_count += session.surrender_count
-            result.double_count += session.double_count
-            result.split_count += session.split_count
-            # Track max streaks across all sessions
-            if session.max_win_streak > result.max_win_streak:
-                result.max_win_streak = session.max_win_streak
-            if session.max_loss_streak > result.max_loss_streak:
-                result.max_loss_streak = session.max_loss_streak
+                self._collect_sessions(result, [session], retain_sessions)
+            else:
+                # Multi-session mode - divide hands across sessions
+                hands_per_session = total_hands // num_sessions
+
+                pending = []
+                for _ in range(num_sessions):
+                    session = self.run_session(
+                        hands_per_session,
+                        strategy_func,
+                        betting_strategy=betting_strategy,
+                        track_hands=track_hands,
+                        max_tracked_hands=max_tracked_hands
+                    )
+                    pending.append(session)
+                    if not retain_sessions and len(pending) == _FOLD_BATCH:
+                        self._collect_sessions(result, pending, retain_sessions)
+                        pending = []
+                self._collect_sessions(result, pending, retain_sessions)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        result.elapsed_ns = time.perf_counter_ns() - start_ns
 
         return result
 
+    @staticmethod
+    def _collect_sessions(result: SimulationResult, sessions: List[SessionResult],
+                          retain: bool) -> None:
+        """
+        Add a batch of finished sessions to the simulation totals.
+
+        Transposes the per-session counters into columns once, then reduces
+        each column. Unretained sessions are also folded into
+        result.session_ev_stats.
+
+        Args:
+            result: SimulationResult being accumulated
+            sessions: Finished sessions to add
+            retain: If True, also append the sessions to result.sessions
+        """
+        if not sessions:
+            return
+        if retain:
+            result.sessions.extend(sessions)
+        else:
+            result.session_ev_stats = _welford(
+                (s.ev_per_hand for s in sessions), *result.session_ev_stats)
+
+        (hands, payouts, wagered, wins, losses, pushes, blackjacks, busts,
+         surrenders, doubles, splits, win_streaks, loss_streaks) = zip(
+            *map(_SESSION_COUNTERS, sessions))
+        result.total_hands += sum(hands)
+        result.total_payout = fsum((result.total_payout, *payouts))
+        result.total_wagered = fsum((result.total_wagered, *wagered))
+        result.win_count += sum(wins)
+        result.loss_count += sum(losses)
+        result.push_count += sum(pushes)
+        result.blackjack_count += sum(blackjacks)
+        result.bust_count += sum(busts)
+        result.surrender_count += sum(surrenders)
+        result.double_count += sum(doubles)
+        result.split_count += sum(splits)
+        # Track max streaks across all sessions
+        result.max_win_streak = max(result.max_win_streak, *win_streaks)
+        result.max_loss_streak = max(result.max_loss_streak, *loss_streaks)
+
     def estimate_time(
         self,
         total_hands: int,
@@ -436,26 +664,27 @@ class Simulator:
             cal_sessions = max(10, min(num_sessions, 50))
             cal_total = hands_per_session * cal_sessions
 
-            start = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             self.run_simulation(cal_total, strategy_func, num_sessions=cal_sessions)
-            elapsed = time.perf_counter() - start
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
             # Scale by number of sessions
-            return elapsed * (num_sessions / cal_sessions)
+            return elapsed_ns * num_sessions / cal_sessions / 1e9
         else:
             cal_total = calibration_hands
 
-            start = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             self.run_simulation(cal_total, strategy_func, num_sessions=1)
-            elapsed = time.perf_counter() - start
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
-            return elapsed * (total_hands / cal_total)
+            return elapsed_ns * total_hands / cal_total / 1e9
 
     def compare_strategies(
         self,
         strategy_funcs: List[Callable[[Hand, Card], PlayerAction]],
         strategy_names: List[str],
-        hands_per_strategy: int = 10000
+        hands_per_strategy: int = 10000,
+        max_workers: Optional[int] = None
     ) -> dict:
         """
         Compare multiple strategies.
@@ -464,10 +693,23 @@ class Simulator:
             strategy_funcs: List of strategy functions
             strategy_names: List of strategy names (same length as strategy_funcs)
             hands_per_strategy: Number of hands to test each strategy
+            max_workers: If greater than 1, simulate strategies in parallel in up to
+                         this many worker processes. Strategy functions must then be
+                         picklable (module-level functions or Strategy.get_action,
+                         not lambdas or closures).
 
         Returns:
             Dict mapping strategy names to SimulationResults
         """
+        if max_workers is not None and max_workers > 1 and len(strategy_funcs) > 1:
+            workers = min(max_workers, len(strategy_funcs))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self.run_simulation, hands_per_strategy, func, 1)
+                    for func in strategy_funcs
+                ]
+                return {name: future.result() for name, future in zip(strategy_names, futures)}
+
         results = {}
 
         for func, name in zip(strategy_funcs, strategy_names):
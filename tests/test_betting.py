@@ -3,9 +3,7 @@ Unit tests for betting strategy module.
 """
 
 import os
-import json
 import unittest
-import tempfile
 
 from src.betting import (
     BettingStrategy, FlatBetting, MartingaleBetting,
@@ -29,29 +27,56 @@ class TestFlatBetting(unittest.TestCase):
             s.update('win', 5.0, 5.0)
 
 
-class TestMartingaleBetting(unittest.TestCase):
-    """Test Martingale betting strategy."""
+# (name, strategy class, updates, expected bet before the first update and
+# after each one); every strategy starts at base_unit=1.0, max_bet=1000.0
+BET_PROGRESSIONS = [
+    ('martingale_double_on_loss', MartingaleBetting,
+     [('loss', -1.0, 1.0), ('loss', -2.0, 2.0)], [1.0, 2.0, 4.0]),
+    ('martingale_reset_on_win', MartingaleBetting,
+     [('loss', -1.0, 1.0), ('loss', -2.0, 2.0), ('win', 4.0, 4.0)], [1.0, 2.0, 4.0, 1.0]),
+    ('reverse_martingale_double_on_win', ReverseMartingaleBetting,
+     [('win', 1.0, 1.0), ('win', 2.0, 2.0)], [1.0, 2.0, 4.0]),
+    ('reverse_martingale_reset_on_loss', ReverseMartingaleBetting,
+     [('win', 1.0, 1.0), ('win', 2.0, 2.0), ('loss', -4.0, 4.0)], [1.0, 2.0, 4.0, 1.0]),
+    ('paroli_double_on_win', ParoliBetting,
+     [('win', 1.0, 1.0), ('win', 2.0, 2.0)], [1.0, 2.0, 4.0]),
+    ('paroli_reset_after_three_wins', ParoliBetting,
+     [('win', 1.0, 1.0), ('win', 2.0, 2.0), ('win', 4.0, 4.0)], [1.0, 2.0, 4.0, 1.0]),
+    ('paroli_reset_on_loss', ParoliBetting,
+     [('win', 1.0, 1.0), ('loss', -2.0, 2.0)], [1.0, 2.0, 1.0]),
+    ('dalembert_increase_on_loss', DAlembertBetting,
+     [('loss', -1.0, 1.0), ('loss', -2.0, 2.0)], [1.0, 2.0, 3.0]),
+    ('dalembert_decrease_on_win', DAlembertBetting,
+     [('loss', -1.0, 1.0), ('loss', -2.0, 2.0), ('win', 3.0, 3.0)], [1.0, 2.0, 3.0, 2.0]),
+    ('dalembert_floor_at_one_unit', DAlembertBetting,
+     [('win', 1.0, 1.0)], [1.0, 1.0]),
+    ('dalembert_push_no_change', DAlembertBetting,
+     [('loss', -1.0, 1.0), ('push', 0.0, 2.0)], [1.0, 2.0, 2.0]),
+]
+
+
+class TestBetProgressions(unittest.TestCase):
+    """Test bet progressions of the win/loss-driven strategies."""
+
+    def test_bet_progressions(self):
+        """Test each strategy's bet after every outcome in its sequence."""
+        for name, cls, updates, expected in BET_PROGRESSIONS:
+            with self.subTest(name):
+                s = cls(base_unit=1.0, max_bet=1000.0)
+                self.assertEqual(s.get_bet(), expected[0])
+                for update, bet in zip(updates, expected[1:]):
+                    s.update(*update)
+                    self.assertEqual(s.get_bet(), bet)
 
-    def test_double_on_loss(self):
-        s = MartingaleBetting(base_unit=1.0, max_bet=1000.0)
-        self.assertEqual(s.get_bet(), 1.0)
-        s.update('loss', -1.0, 1.0)
-        self.assertEqual(s.get_bet(), 2.0)
-        s.update('loss', -2.0, 2.0)
-        self.assertEqual(s.get_bet(), 4.0)
 
-    def test_reset_on_win(self):
-        s = MartingaleBetting(base_unit=1.0, max_bet=1000.0)
-        s.update('loss', -1.0, 1.0)
-        s.update('loss', -2.0, 2.0)
-        self.assertEqual(s.get_bet(), 4.0)
-        s.update('win', 4.0, 4.0)
-        self.assertEqual(s.get_bet(), 1.0)
+class TestMartingaleBetting(unittest.TestCase):
+    """Test Martingale betting strategy."""
 
     def test_max_bet_cap(self):
         s = MartingaleBetting(base_unit=1.0, max_bet=8.0)
         for _ in range(10):
-            s.update('loss', -s.get_bet(), s.get_bet())
+            bet = s.get_bet()
+            s.update('loss', -bet, bet)
         self.assertEqual(s.get_bet(), 8.0)
 
     def test_reset(self):
@@ -62,28 +87,16 @@ class TestMartingaleBetting(unittest.TestCase):
         self.assertEqual(s.get_bet(), 1.0)
 
 
-class TestReverseMartingaleBetting(unittest.TestCase):
-    """Test Reverse Martingale betting strategy."""
-
-    def test_double_on_win(self):
-        s = ReverseMartingaleBetting(base_unit=1.0, max_bet=1000.0)
-        self.assertEqual(s.get_bet(), 1.0)
-        s.update('win', 1.0, 1.0)
-        self.assertEqual(s.get_bet(), 2.0)
-        s.update('win', 2.0, 2.0)
-        self.assertEqual(s.get_bet(), 4.0)
-
-    def test_reset_on_loss(self):
-        s = ReverseMartingaleBetting(base_unit=1.0, max_bet=1000.0)
-        s.update('win', 1.0, 1.0)
-        s.update('win', 2.0, 2.0)
-        s.update('loss', -4.0, 4.0)
-        self.assertEqual(s.get_bet(), 1.0)
-
-
 class TestSequence1326Betting(unittest.TestCase):
     """Test 1-3-2-6 betting strategy."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.strategy = Sequence1326Betting(base_unit=1.0, max_bet=1000.0)
+
+    def setUp(self):
+        self.strategy.reset()
+
     def test_sequence_on_wins(self):
         s = Sequence1326Betting(base_unit=5.0, max_bet=1000.0)
         self.assertEqual(s.get_bet(), 5.0)   # 1 * 5
@@ -95,15 +108,16 @@ class TestSequence1326Betting(unittest.TestCase):
         self.assertEqual(s.get_bet(), 30.0)  # 6 * 5
 
     def test_stays_at_end_of_sequence(self):
-        s = Sequence1326Betting(base_unit=1.0, max_bet=1000.0)
+        s = self.strategy
         # Win 4 times to get to end
         for _ in range(4):
-            s.update('win', s.get_bet(), s.get_bet())
+            bet = s.get_bet()
+            s.update('win', bet, bet)
         # Should stay at position 3 (bet=6)
         self.assertEqual(s.get_bet(), 6.0)
 
     def test_reset_on_loss(self):
-        s = Sequence1326Betting(base_unit=1.0, max_bet=1000.0)
+        s = self.strategy
         s.update('win', 1.0, 1.0)
         s.update('win', 3.0, 3.0)
         self.assertEqual(s.get_bet(), 2.0)
@@ -111,87 +125,36 @@ class TestSequence1326Betting(unittest.TestCase):
         self.assertEqual(s.get_bet(), 1.0)
 
 
-class TestParoliBetting(unittest.TestCase):
-    """Test Paroli betting strategy."""
-
-    def test_double_on_win(self):
-        s = ParoliBetting(base_unit=1.0, max_bet=1000.0)
-        self.assertEqual(s.get_bet(), 1.0)
-        s.update('win', 1.0, 1.0)
-        self.assertEqual(s.get_bet(), 2.0)
-        s.update('win', 2.0, 2.0)
-        self.assertEqual(s.get_bet(), 4.0)
-
-    def test_reset_after_three_wins(self):
-        s = ParoliBetting(base_unit=1.0, max_bet=1000.0)
-        s.update('win', 1.0, 1.0)
-        s.update('win', 2.0, 2.0)
-        s.update('win', 4.0, 4.0)  # 3rd win - reset
-        self.assertEqual(s.get_bet(), 1.0)
-
-    def test_reset_on_loss(self):
-        s = ParoliBetting(base_unit=1.0, max_bet=1000.0)
-        s.update('win', 1.0, 1.0)
-        self.assertEqual(s.get_bet(), 2.0)
-        s.update('loss', -2.0, 2.0)
-        self.assertEqual(s.get_bet(), 1.0)
-
-
-class TestDAlembertBetting(unittest.TestCase):
-    """Test D'Alembert betting strategy."""
-
-    def test_increase_on_loss(self):
-        s = DAlembertBetting(base_unit=1.0, max_bet=1000.0)
-        self.assertEqual(s.get_bet(), 1.0)
-        s.update('loss', -1.0, 1.0)
-        self.assertEqual(s.get_bet(), 2.0)
-        s.update('loss', -2.0, 2.0)
-        self.assertEqual(s.get_bet(), 3.0)
-
-    def test_decrease_on_win(self):
-        s = DAlembertBetting(base_unit=1.0, max_bet=1000.0)
-        s.update('loss', -1.0, 1.0)
-        s.update('loss', -2.0, 2.0)
-        self.assertEqual(s.get_bet(), 3.0)
-        s.update('win', 3.0, 3.0)
-        self.assertEqual(s.get_bet(), 2.0)
-
-    def test_floor_at_one_unit(self):
-        s = DAlembertBetting(base_unit=1.0, max_bet=1000.0)
-        self.assertEqual(s.get_bet(), 1.0)
-        s.update('win', 1.0, 1.0)
-        # Should not go below 1 unit
-        self.assertEqual(s.get_bet(), 1.0)
-
-    def test_push_no_change(self):
-        s = DAlembertBetting(base_unit=1.0, max_bet=1000.0)
-        s.update('loss', -1.0, 1.0)
-        self.assertEqual(s.get_bet(), 2.0)
-        s.update('push', 0.0, 2.0)
-        self.assertEqual(s.get_bet(), 2.0)
-
-
 class TestFibonacciBetting(unittest.TestCase):
     """Test Fibonacci betting strategy."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.strategy = FibonacciBetting(base_unit=1.0, max_bet=1000.0)
+
+    def setUp(self):
+        self.strategy.reset()
+
     def test_fibonacci_on_losses(self):
-        s = FibonacciBetting(base_unit=1.0, max_bet=1000.0)
+        s = self.strategy
         expected = [1, 1, 2, 3, 5, 8, 13]
         for exp in expected:
-            self.assertEqual(s.get_bet(), float(exp))
-            s.update('loss', -s.get_bet(), s.get_bet())
+            bet = s.get_bet()
+            self.assertEqual(bet, float(exp))
+            s.update('loss', -bet, bet)
 
     def test_step_back_two_on_win(self):
-        s = FibonacciBetting(base_unit=1.0, max_bet=1000.0)
+        s = self.strategy
         # Lose 4 times: positions 0,1,2,3 → bets 1,1,2,3 → now at position 4 (bet=5)
         for _ in range(4):
-            s.update('loss', -s.get_bet(), s.get_bet())
+            bet = s.get_bet()
+            s.update('loss', -bet, bet)
         self.assertEqual(s.get_bet(), 5.0)  # position 4
         s.update('win', 5.0, 5.0)
         self.assertEqual(s.get_bet(), 2.0)  # position 2
 
     def test_win_at_start_stays_at_start(self):
-        s = FibonacciBetting(base_unit=1.0, max_bet=1000.0)
+        s = self.strategy
         self.assertEqual(s.get_bet(), 1.0)
         s.update('win', 1.0, 1.0)
         self.assertEqual(s.get_bet(), 1.0)  # Can't go below 0
@@ -200,6 +163,14 @@ class TestFibonacciBetting(unittest.TestCase):
 class TestHiLoCountingBetting(unittest.TestCase):
     """Test Hi-Lo card counting betting strategy."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Tests only set running_count, so one undealt shoe serves them all
+        cls.shoe = Shoe(num_decks=6, penetration=1.0)
+
+    def setUp(self):
+        self.shoe.running_count = 0
+
     def test_flat_bet_without_shoe(self):
         """Test that strategy bets flat when no shoe is set."""
         s = HiLoCountingBetting(base_unit=10.0)
@@ -215,34 +186,21 @@ class TestHiLoCountingBetting(unittest.TestCase):
     def test_bet_spread_based_on_true_count(self):
         """Test that bet increases with true count."""
         s = HiLoCountingBetting(base_unit=10.0, spread={1: 1, 2: 2, 3: 4, 4: 8})
-        shoe = Shoe(num_decks=6, penetration=1.0)
+        shoe = self.shoe
         s.set_shoe(shoe)
 
-        # At TC=0, should bet 1 unit (threshold 1 not reached)
-        shoe.running_count = 0
-        # TC = 0 / 6 = 0, below threshold 1
-        self.assertEqual(s.get_bet(), 10.0)
-
-        # At TC=1, should bet 1 unit
-        shoe.running_count = 6  # TC = 6/6 = 1
-        self.assertEqual(s.get_bet(), 10.0)
-
-        # At TC=2, should bet 2 units
-        shoe.running_count = 12  # TC = 12/6 = 2
-        self.assertEqual(s.get_bet(), 20.0)
-
-        # At TC=3, should bet 4 units
-        shoe.running_count = 18  # TC = 18/6 = 3
-        self.assertEqual(s.get_bet(), 40.0)
-
-        # At TC=4+, should bet 8 units
-        shoe.running_count = 24  # TC = 24/6 = 4
-        self.assertEqual(s.get_bet(), 80.0)
+        # (running count, expected bet); 6 decks, so TC = running count / 6.
+        # TC=0 is below the first threshold; TC=4+ bets the top of the spread
+        cases = [(0, 10.0), (6, 10.0), (12, 20.0), (18, 40.0), (24, 80.0)]
+        for running_count, expected in cases:
+            with self.subTest(tc=running_count // 6):
+                shoe.running_count = running_count
+                self.assertEqual(s.get_bet(), expected)
 
     def test_max_bet_cap(self):
         """Test that bet is capped at max_bet."""
         s = HiLoCountingBetting(base_unit=100.0, max_bet=500.0, spread={1: 1, 4: 8})
-        shoe = Shoe(num_decks=6, penetration=1.0)
+        shoe = self.shoe
         s.set_shoe(shoe)
 
         # TC=4 would give 8 * 100 = 800, but capped at 500
@@ -252,7 +210,7 @@ class TestHiLoCountingBetting(unittest.TestCase):
     def test_negative_true_count(self):
         """Test that negative true count gives minimum bet."""
         s = HiLoCountingBetting(base_unit=10.0, spread={1: 1, 2: 2, 3: 4, 4: 8})
-        shoe = Shoe(num_decks=6, penetration=1.0)
+        shoe = self.shoe
         s.set_shoe(shoe)
 
         # Negative count (player disadvantage)
@@ -262,7 +220,7 @@ class TestHiLoCountingBetting(unittest.TestCase):
     def test_custom_spread(self):
         """Test with a custom conservative spread."""
         s = HiLoCountingBetting(base_unit=5.0, spread={1: 1, 2: 2, 3: 3, 4: 4})
-        shoe = Shoe(num_decks=6, penetration=1.0)
+        shoe = self.shoe
         s.set_shoe(shoe)
 
         shoe.running_count = 18  # TC = 3
@@ -272,8 +230,8 @@ class TestHiLoCountingBetting(unittest.TestCase):
         self.assertEqual(s.get_bet(), 20.0)  # 4 * 5 (max spread level)
 
 
-class TestFromJson(unittest.TestCase):
-    """Test loading strategies from JSON config files."""
+class TestFromDict(unittest.TestCase):
+    """Test building strategies from parsed config dicts."""
 
     def test_load_martingale(self):
         config = {
@@ -281,22 +239,14 @@ class TestFromJson(unittest.TestCase):
             "type": "martingale",
             "params": {"base_unit": 5.0, "max_bet": 500.0}
         }
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config, f)
-            f.flush()
-            s = BettingStrategy.from_json(f.name)
-        os.unlink(f.name)
+        s = BettingStrategy.from_dict(config)
         self.assertIsInstance(s, MartingaleBetting)
         self.assertEqual(s.base_unit, 5.0)
         self.assertEqual(s.max_bet, 500.0)
 
     def test_load_unknown_type_defaults_to_flat(self):
         config = {"type": "nonexistent", "params": {}}
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config, f)
-            f.flush()
-            s = BettingStrategy.from_json(f.name)
-        os.unlink(f.name)
+        s = BettingStrategy.from_dict(config)
         self.assertIsInstance(s, FlatBetting)
 
 
@@ -314,12 +264,21 @@ class TestStrategyRegistry(unittest.TestCase):
         config_dir = os.path.join(os.path.dirname(__file__), '..', 'config', 'betting_strategies')
         if not os.path.isdir(config_dir):
             self.skipTest('Config directory not found')
-        for fname in os.listdir(config_dir):
-            if fname.endswith('.json'):
-                path = os.path.join(config_dir, fname)
-                s = BettingStrategy.from_json(path)
+        fnames = sorted(f for f in os.listdir(config_dir) if f.endswith('.json'))
+        for fname in fnames:
+            with self.subTest(fname):
+                s = BettingStrategy.from_json(os.path.join(config_dir, fname))
                 self.assertIsInstance(s, BettingStrategy)
-                self.assertGreater(s.get_bet(), 0)
+                self.assertGreater(s.base_unit, 0)
+
+    def test_flat_config_bets_base_unit(self):
+        """The shipped flat config should load and bet its base unit."""
+        path = os.path.join(os.path.dirname(__file__), '..', 'config', 'betting_strategies', 'flat.json')
+        if not os.path.isfile(path):
+            self.skipTest('flat.json not found')
+        s = BettingStrategy.from_json(path)
+        self.assertIsInstance(s, FlatBetting)
+        self.assertEqual(s.get_bet(), s.base_unit)
 
 
 if __name__ == '__main__':
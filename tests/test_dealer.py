@@ -10,6 +10,12 @@ from src.dealer import Dealer
 class TestDealer(unittest.TestCase):
     """Test cases for Dealer class."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared by every test: dealer draws only need random cards, and an infinite
+        # shoe never runs out. Its draw buffer carries over between tests.
+        cls.infinite_shoe = Shoe(num_decks=1, infinite=True)
+
     def test_dealer_creation(self):
         """Test creating a dealer."""
         dealer = Dealer()
@@ -54,62 +60,31 @@ class TestDealer(unittest.TestCase):
         with self.assertRaises(ValueError):
             dealer.holecard()
 
-    def test_should_hit_on_16(self):
-        """Test dealer hits on 16."""
-        dealer = Dealer()
-        dealer.hand.add_card(Card('K', '♠'))
-        dealer.hand.add_card(Card('6', '♥'))
-        self.assertEqual(dealer.hand.value(), 16)
-        self.assertTrue(dealer.should_hit())
-
-    def test_should_stand_on_hard_17(self):
-        """Test dealer stands on hard 17."""
-        dealer = Dealer()
-        dealer.hand.add_card(Card('K', '♠'))
-        dealer.hand.add_card(Card('7', '♥'))
-        self.assertEqual(dealer.hand.value(), 17)
-        self.assertFalse(dealer.hand.is_soft())
-        self.assertFalse(dealer.should_hit())
-
-    def test_should_stand_on_soft_17_default(self):
-        """Test dealer stands on soft 17 by default."""
-        dealer = Dealer(hits_soft_17=False)
-        dealer.hand.add_card(Card('A', '♠'))
-        dealer.hand.add_card(Card('6', '♥'))
-        self.assertEqual(dealer.hand.value(), 17)
-        self.assertTrue(dealer.hand.is_soft())
-        self.assertFalse(dealer.should_hit())
-
-    def test_should_hit_soft_17_when_enabled(self):
-        """Test dealer hits soft 17 when rule is enabled."""
-        dealer = Dealer(hits_soft_17=True)
-        dealer.hand.add_card(Card('A', '♠'))
-        dealer.hand.add_card(Card('6', '♥'))
-        self.assertEqual(dealer.hand.value(), 17)
-        self.assertTrue(dealer.hand.is_soft())
-        self.assertTrue(dealer.should_hit())
-
-    def test_should_stand_on_18(self):
-        """Test dealer stands on 18."""
-        dealer = Dealer()
-        dealer.hand.add_card(Card('K', '♠'))
-        dealer.hand.add_card(Card('8', '♥'))
-        self.assertEqual(dealer.hand.value(), 18)
-        self.assertFalse(dealer.should_hit())
-
-    def test_should_stand_on_soft_18(self):
-        """Test dealer stands on soft 18 (even with H17 rule)."""
-        dealer = Dealer(hits_soft_17=True)
-        dealer.hand.add_card(Card('A', '♠'))
-        dealer.hand.add_card(Card('7', '♥'))
-        self.assertEqual(dealer.hand.value(), 18)
-        self.assertTrue(dealer.hand.is_soft())
-        self.assertFalse(dealer.should_hit())
+    # (case, hits_soft_17, first card, second card, value, soft, should hit)
+    SHOULD_HIT_CASES = [
+        ('hit_on_16', False, 'K', '6', 16, False, True),
+        ('stand_on_hard_17', False, 'K', '7', 17, False, False),
+        ('stand_on_soft_17_default', False, 'A', '6', 17, True, False),
+        ('hit_soft_17_when_enabled', True, 'A', '6', 17, True, True),
+        ('stand_on_18', False, 'K', '8', 18, False, False),
+        ('stand_on_soft_18_even_with_h17', True, 'A', '7', 18, True, False),
+    ]
+
+    def test_should_hit(self):
+        """Test dealer hit/stand decisions for hard and soft totals under S17/H17."""
+        for case, hits_soft_17, rank1, rank2, value, soft, expected in self.SHOULD_HIT_CASES:
+            with self.subTest(case):
+                dealer = Dealer(hits_soft_17=hits_soft_17)
+                dealer.hand.add_card(Card(rank1, '♠'))
+                dealer.hand.add_card(Card(rank2, '♥'))
+                self.assertEqual(dealer.hand.value(), value)
+                self.assertEqual(dealer.hand.is_soft(), soft)
+                self.assertEqual(dealer.should_hit(), expected)
 
     def test_play_hand_simple(self):
         """Test dealer playing out a simple hand."""
         dealer = Dealer()
-        shoe = Shoe(num_decks=1, infinite=True)
+        shoe = self.infinite_shoe
 
         # Give dealer 16 (should hit)
         dealer.hand.add_card(Card('K', '♠'))
@@ -156,7 +131,7 @@ class TestDealer(unittest.TestCase):
     def test_play_hand_soft_17_hit(self):
         """Test dealer hits soft 17 when rule enabled."""
         dealer = Dealer(hits_soft_17=True)
-        shoe = Shoe(num_decks=1, infinite=True)
+        shoe = self.infinite_shoe
 
         # Give dealer soft 17
         dealer.hand.add_card(Card('A', '♠'))
@@ -5,6 +5,60 @@ Unit tests for game module.
 import unittest
 from src.cards import Card, Shoe
 from src.game import BlackjackGame, GameRules, PlayerAction, HandOutcome
+from src.game import HIT_BIT, STAND_BIT, DOUBLE_BIT, SURRENDER_BIT
+
+
+def set_cards(game, player_ranks, dealer_ranks):
+    """Replace the player's and dealer's hands with the given two-card hands."""
+    game.player_hand.clear()
+    game.dealer.hand.clear()
+    for rank, suit in zip(player_ranks, ('♠', '♥')):
+        game.player_hand.add_card(Card(rank, suit))
+    for rank, suit in zip(dealer_ranks, ('♦', '♣')):
+        game.dealer.hand.add_card(Card(rank, suit))
+
+
+def always_stand(player_hand, dealer_upcard):
+    """Always stand."""
+    return PlayerAction.STAND
+
+
+def hit_to_17(player_hand, dealer_upcard):
+    """Hit until 17 or more."""
+    if player_hand.value() < 17:
+        return PlayerAction.HIT
+    return PlayerAction.STAND
+
+
+def always_hit(player_hand, dealer_upcard):
+    """Always hit."""
+    return PlayerAction.HIT
+
+
+def hit_once(player_hand, dealer_upcard):
+    """Hit the first two cards once, then stand."""
+    if len(player_hand) == 2:
+        return PlayerAction.HIT
+    return PlayerAction.STAND
+
+
+def double_on_11(player_hand, dealer_upcard):
+    """Double on a two-card 11, otherwise stand."""
+    if player_hand.value() == 11 and len(player_hand) == 2:
+        return PlayerAction.DOUBLE
+    return PlayerAction.STAND
+
+
+def split_pairs(player_hand, dealer_upcard):
+    """Split any pair, otherwise stand."""
+    if player_hand.is_pair():
+        return PlayerAction.SPLIT
+    return PlayerAction.STAND
+
+
+def always_surrender(player_hand, dealer_upcard):
+    """Always try to surrender."""
+    return PlayerAction.SURRENDER
 
 
 class TestGameRules(unittest.TestCase):
@@ -33,6 +87,12 @@ class TestGameRules(unittest.TestCase):
 class TestBlackjackGame(unittest.TestCase):
     """Test cases for BlackjackGame class."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Shared by every test. No assertion depends on which cards it deals next,
+        # so draws left in its buffer by earlier tests don't matter.
+        cls.infinite_shoe = Shoe(num_decks=1, infinite=True)
+
     def test_game_creation(self):
         """Test creating a blackjack game."""
         shoe = Shoe(num_decks=1)
@@ -110,7 +170,7 @@ class TestBlackjackGame(unittest.TestCase):
 
     def test_player_stands_and_wins(self):
         """Test player standing and winning."""
-        shoe = Shoe(num_decks=1, infinite=True)
+        shoe = self.infinite_shoe
         game = BlackjackGame(shoe)
 
         # Player has 20
@@ -130,7 +190,7 @@ class TestBlackjackGame(unittest.TestCase):
 
     def test_player_hits_strategy(self):
         """Test player hitting with a strategy function."""
-        shoe = Shoe(num_decks=1, infinite=True)
+        shoe = self.infinite_shoe
         game = BlackjackGame(shoe)
 
         # Player has 12
@@ -141,12 +201,6 @@ class TestBlackjackGame(unittest.TestCase):
         game.dealer.hand.add_card(Card('6', '♠'))
         game.dealer.hand.add_card(Card('10', '♥'))
 
-        # Strategy: hit until 17+
-        def hit_to_17(player_hand, dealer_upcard):
-            if player_hand.value() < 17:
-                return PlayerAction.HIT
-            return PlayerAction.STAND
-
         result = game.play_hand(strategy_func=hit_to_17, deal_cards=False)
 
         # Player should have hit at least once
@@ -165,10 +219,6 @@ class TestBlackjackGame(unittest.TestCase):
         game.dealer.hand.add_card(Card('7', '♠'))
         game.dealer.hand.add_card(Card('8', '♥'))
 
-        # Strategy: always hit (will bust on first hit)
-        def always_hit(player_hand, dealer_upcard):
-            return PlayerAction.HIT
-
         result = game.play_hand(strategy_func=always_hit, deal_cards=False)
 
         self.assertEqual(result.outcome, HandOutcome.PLAYER_BUST)
@@ -190,7 +240,7 @@ class TestBlackjackGame(unittest.TestCase):
 
         # Add a card to shoe that will bust dealer
         # (In infinite shoe, dealer will keep drawing until bust or stand)
-        shoe_inf = Shoe(num_decks=1, infinite=True)
+        shoe_inf = self.infinite_shoe
         game.shoe = shoe_inf
 
         result = game.play_hand()  # Player stands by default
@@ -217,96 +267,124 @@ class TestBlackjackGame(unittest.TestCase):
         self.assertEqual(result.outcome, HandOutcome.PUSH)
         self.assertEqual(result.payout, 0.0)
 
-    def test_double_down(self):
-        """Test doubling down."""
-        shoe = Shoe(num_decks=1)
-        game = BlackjackGame(shoe)
-
-        # Player has 11
-        game.player_hand.add_card(Card('6', '♠'))
-        game.player_hand.add_card(Card('5', '♥'))
-
-        # Dealer has anything
-        game.dealer.hand.add_card(Card('7', '♠'))
-        game.dealer.hand.add_card(Card('10', '♥'))
+    # (case, rules, player ranks, dealer ranks, strategy, allowed payouts,
+    # expected outcome or None if it depends on the draw, expected total bet,
+    # expected player card count)
+    RULE_SCENARIOS = [
+        # Double on 11: one more card and the bet is doubled
+        ('double_down', GameRules(), ('6', '5'), ('7', '10'), double_on_11,
+         (-2.0, 0.0, 2.0), None, 2.0, 3),
+        # Surrender against an ace loses half the bet
+        ('surrender', GameRules(), ('K', '6'), ('A', '7'), always_surrender,
+         (-0.5,), HandOutcome.DEALER_WIN, 1.0, 2),
+        # Surrender is treated as stand when not allowed: never -0.5
+        ('surrender_not_allowed', GameRules(surrender_allowed=False), ('K', '6'), ('7', '8'),
+         always_surrender, (-1.0, 0.0, 1.0), None, 1.0, 2),
+        # 6:5 blackjack payout
+        ('blackjack_payout_6_5', GameRules(blackjack_payout=1.2), ('A', 'K'), ('10', '9'),
+         None, (1.2,), HandOutcome.PLAYER_BLACKJACK, 1.0, 2),
+    ]
+
+    def test_rule_scenarios(self):
+        """Test doubling, surrender (allowed or not) and 6:5 blackjack payouts."""
+        for (case, rules, player, dealer, strategy, payouts, outcome, bet,
+             num_cards) in self.RULE_SCENARIOS:
+            with self.subTest(case):
+                game = BlackjackGame(self.infinite_shoe, rules=rules)
+                set_cards(game, player, dealer)
+
+                result = game.play_hand(strategy_func=strategy, deal_cards=False)
+
+                self.assertIn(result.payout, payouts)
+                if outcome is not None:
+                    self.assertEqual(result.outcome, outcome)
+                self.assertEqual(result.bet, bet)
+                self.assertEqual(len(result.player_hand), num_cards)
+
+    def test_capture_state(self):
+        """Test that initial state is recorded by default and skipped without capture_state."""
+        game = BlackjackGame(self.infinite_shoe)
+
+        set_cards(game, ('K', '9'), ('10', '8'))
+        result = game.play_hand(strategy_func=always_stand, deal_cards=False, capture_state=False)
+        self.assertIsNone(result.initial_player_hand)
+        self.assertIsNone(result.initial_dealer_upcard)
+        self.assertIsNone(result.split_hands_final)
+        self.assertEqual(result.actions, ['stand'])
+
+        set_cards(game, ('K', '9'), ('10', '8'))
+        result = game.play_hand(strategy_func=always_stand, deal_cards=False)
+        self.assertEqual(result.initial_player_hand.value(), 19)
+        self.assertEqual(result.initial_dealer_upcard, '10')
+        self.assertEqual(len(result.split_hands_final), 1)
+        self.assertEqual(result.actions, ['stand'])
+
+        # No strategy: the stand-only fast path captures the same state
+        set_cards(game, ('K', '9'), ('10', '8'))
+        result = game.play_hand(deal_cards=False)
+        self.assertEqual(result.initial_player_hand.value(), 19)
+        self.assertEqual(result.split_hands_final, [{
+            'cards': ['K♠', '9♥'], 'value': 19, 'soft': False, 'bust': False,
+            'actions': ['stand']
+        }])
+
+        set_cards(game, ('K', '9'), ('10', '8'))
+        result = game.play_hand(deal_cards=False, capture_state=False)
+        self.assertIsNone(result.split_hands_final)
+
+    def test_reset(self):
+        """Test resetting a game for another hand."""
+        game = BlackjackGame(Shoe(num_decks=1))
+        result = game.play_hand()
+        player_hand = result.player_hand
 
-        # Strategy: double on 11
-        def double_on_11(player_hand, dealer_upcard):
-            if player_hand.value() == 11 and len(player_hand) == 2:
-                return PlayerAction.DOUBLE
-            return PlayerAction.STAND
+        game.reset(bet=2.0)
+        self.assertEqual(game.bet, 2.0)
+        self.assertIs(game.player_hand, player_hand)
+        self.assertEqual(len(game.player_hand), 0)
+        self.assertEqual(len(game.dealer.hand), 0)
 
+        result = game.play_hand()
+        kept_cards = result.player_hand.cards
+        game.reset(new_hands=True)
+        self.assertIsNot(game.player_hand, result.player_hand)
+        self.assertEqual(result.player_hand.cards, kept_cards)
+        self.assertEqual(game.bet, 1.0)
+
+    def test_split_result_kept_across_plays(self):
+        """Test that a kept split result isn't overwritten by the next play without reset."""
+        game = BlackjackGame(self.infinite_shoe)
+
+        set_cards(game, ('8', '8'), ('10', '7'))
+        first = game.play_hand(strategy_func=split_pairs, deal_cards=False)
+        kept_cards = first.player_hand.cards
+        self.assertGreaterEqual(first.split_hands_count, 2)
+
+        set_cards(game, ('8', '8'), ('10', '7'))
+        second = game.play_hand(strategy_func=split_pairs, deal_cards=False)
+        self.assertIsNot(second.player_hand, first.player_hand)
+        self.assertEqual(first.player_hand.cards, kept_cards)
+
+    def test_actions_mask(self):
+        """Test that actions_mask records each action taken."""
+        game = BlackjackGame(self.infinite_shoe)
+
+        set_cards(game, ('6', '5'), ('10', '7'))
         result = game.play_hand(strategy_func=double_on_11, deal_cards=False)
+        self.assertEqual(result.actions_mask, DOUBLE_BIT)
 
-        # Player should have exactly 3 cards (initial 2 + 1 from double)
-        self.assertEqual(len(result.player_hand), 3)
-        # Bet should be doubled
-        self.assertEqual(result.bet, 2.0)
+        set_cards(game, ('6', '5'), ('10', '7'))
+        result = game.play_hand(strategy_func=hit_once, deal_cards=False)
+        self.assertTrue(result.actions_mask & HIT_BIT)
+        self.assertFalse(result.actions_mask & DOUBLE_BIT)
 
-    def test_surrender(self):
-        """Test surrendering."""
-        shoe = Shoe(num_decks=1)
-        game = BlackjackGame(shoe)
-
-        # Player has 16
-        game.player_hand.add_card(Card('K', '♠'))
-        game.player_hand.add_card(Card('6', '♥'))
-
-        # Dealer shows ace
-        game.dealer.hand.add_card(Card('A', '♠'))
-        game.dealer.hand.add_card(Card('7', '♥'))
-
-        # Strategy: always surrender
-        def always_surrender(player_hand, dealer_upcard):
-            return PlayerAction.SURRENDER
-
-        result = game.play_hand(strategy_func=always_surrender)
-
-        # Should lose half bet
-        self.assertEqual(result.payout, -0.5)
-
-    def test_surrender_not_allowed(self):
-        """Test that surrender is treated as stand when not allowed."""
-        rules = GameRules(surrender_allowed=False)
-        shoe = Shoe(num_decks=1, infinite=True)
-        game = BlackjackGame(shoe, rules=rules)
-
-        # Player has 16
-        game.player_hand.add_card(Card('K', '♠'))
-        game.player_hand.add_card(Card('6', '♥'))
-
-        # Dealer has anything
-        game.dealer.hand.add_card(Card('7', '♠'))
-        game.dealer.hand.add_card(Card('8', '♥'))
-
-        # Try to surrender
-        def try_surrender(player_hand, dealer_upcard):
-            return PlayerAction.SURRENDER
-
-        result = game.play_hand(strategy_func=try_surrender)
-
-        # Should play out normally (not surrender)
-        # Payout should be -1 or +1, not -0.5
-        self.assertIn(result.payout, [-1.0, 0.0, 1.0])
-
-    def test_blackjack_payout_6_5(self):
-        """Test 6:5 blackjack payout."""
-        rules = GameRules(blackjack_payout=1.2)  # 6:5
-        shoe = Shoe(num_decks=1)
-        game = BlackjackGame(shoe, rules=rules)
-
-        # Player gets blackjack
-        game.player_hand.add_card(Card('A', '♠'))
-        game.player_hand.add_card(Card('K', '♥'))
-
-        # Dealer doesn't
-        game.dealer.hand.add_card(Card('10', '♠'))
-        game.dealer.hand.add_card(Card('9', '♥'))
+        set_cards(game, ('6', '5'), ('10', '7'))
+        result = game.play_hand(strategy_func=always_surrender, deal_cards=False)
+        self.assertEqual(result.actions_mask, SURRENDER_BIT)
 
+        set_cards(game, ('6', '5'), ('10', '7'))
         result = game.play_hand(deal_cards=False)
-
-        self.assertEqual(result.outcome, HandOutcome.PLAYER_BLACKJACK)
-        self.assertEqual(result.payout, 1.2)  # 6:5 payout
+        self.assertEqual(result.actions_mask, STAND_BIT)
 
 
 if __name__ == '__main__':
@@ -2,6 +2,9 @@
 Unit tests for player strategy module.
 """
 
+import json
+import os
+import tempfile
 import unittest
 from src.player import Strategy
 from src.hand import Hand
@@ -12,12 +15,13 @@ from src.game import PlayerAction
 class TestStrategy(unittest.TestCase):
     """Test cases for Strategy class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Load the strategies once; no test mutates them."""
         # Load basic strategy
-        self.basic_strategy = Strategy('config/strategies/basic_strategy_h17.json')
+        cls.basic_strategy = Strategy('config/strategies/basic_strategy_h17.json')
         # Load never bust strategy
-        self.never_bust = Strategy('config/strategies/never_bust.json')
+        cls.never_bust = Strategy('config/strategies/never_bust.json')
 
     def test_load_basic_strategy(self):
         """Test loading basic strategy from JSON."""
@@ -245,6 +249,44 @@ class TestStrategy(unittest.TestCase):
         self.assertEqual(str(self.basic_strategy), "Basic Strategy (H17, Surrender)")
         self.assertIn("Basic Strategy", repr(self.basic_strategy))
 
+    def test_reload_after_file_change(self):
+        """Test that editing a strategy file is picked up on the next load."""
+        def write_strategy(path, action):
+            with open(path, 'w') as f:
+                json.dump({
+                    'name': f'Always {action}',
+                    'strategy': {'hard_totals': {'16': {'10': action}}}
+                }, f)
+
+        hand = Hand()
+        hand.add_card(Card('10', '♠'))
+        hand.add_card(Card('6', '♥'))
+        dealer_10 = Card('10', '♣')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'strategy.json')
+
+            write_strategy(path, 'hit')
+            self.assertEqual(Strategy(path).get_action(hand, dealer_10), PlayerAction.HIT)
+            self.assertEqual(Strategy(path).get_action(hand, dealer_10), PlayerAction.HIT)
+
+            write_strategy(path, 'stand')
+            strategy = Strategy(path)
+            self.assertEqual(strategy.name, 'Always stand')
+            self.assertEqual(strategy.get_action(hand, dealer_10), PlayerAction.STAND)
+
+    def test_cached_loads_are_independent(self):
+        """Test that editing one instance's data doesn't affect later loads of the same file."""
+        path = 'config/strategies/basic_strategy_h17.json'
+        first = Strategy(path)
+        first.rules['edited'] = True
+        first.hard_totals['16']['10'] = 'stand'
+
+        second = Strategy(path)
+        self.assertNotIn('edited', second.rules)
+        self.assertNotEqual(second.hard_totals['16']['10'], 'stand')
+        self.assertEqual(second.rules, self.basic_strategy.rules)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,8 @@ import csv
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
+from src import reporter
 from src.reporter import (
     export_summary_csv,
     export_sessions_csv,
@@ -131,6 +133,22 @@ class TestExportSessionsCSV(unittest.TestCase):
             # Check second session
             self.assertEqual(rows[1]['session_num'], '2')
 
+    def test_export_recreates_deleted_directory(self):
+        """Test that a second export recreates an output directory deleted in between."""
+        import shutil
+        result = SimulationResult(
+            total_hands=100,
+            sessions=[SessionResult(hands_played=100, total_payout=-1.0)]
+        )
+
+        out_dir = os.path.join(self.temp_dir, 'out')
+        filepath = os.path.join(out_dir, 'sessions.csv')
+        export_sessions_csv(result, filepath)
+        shutil.rmtree(out_dir)
+
+        export_sessions_csv(result, filepath)
+        self.assertTrue(os.path.exists(filepath))
+
     def test_export_sessions_csv_no_sessions(self):
         """Test that no file is created when there are no sessions."""
         result = SimulationResult(total_hands=0, sessions=[])
@@ -376,6 +394,45 @@ class TestExportToJSON(unittest.TestCase):
         self.assertIn('session_ev_stdev', data['variance'])
 
 
+    def test_export_to_json_folded_sessions(self):
+        """Test that variance stats come from the folded stats when sessions aren't retained."""
+        sim = Simulator(infinite_shoe=True)
+        result = sim.run_simulation(1000, None, num_sessions=10, retain_sessions=False)
+
+        filepath = os.path.join(self.temp_dir, 'folded.json')
+        export_to_json(result, filepath)
+
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+
+        self.assertEqual(data['sessions'], [])
+        self.assertEqual(data['variance']['session_ev_mean'], round(result.session_ev_mean, 6))
+        self.assertEqual(data['variance']['session_ev_stdev'], round(result.session_ev_stdev, 6))
+
+    def test_export_to_json_orjson_matches_json(self):
+        """Test that the orjson and json.dumps paths write equivalent JSON."""
+        if reporter.orjson is None:
+            self.skipTest("orjson not installed")
+
+        sessions = [
+            SessionResult(hands_played=100, total_payout=-0.001),
+            SessionResult(hands_played=100, total_payout=1.5)
+        ]
+        result = SimulationResult(total_hands=200, total_payout=1.499, sessions=sessions)
+
+        fast_path = os.path.join(self.temp_dir, 'orjson.json')
+        plain_path = os.path.join(self.temp_dir, 'json.json')
+        export_to_json(result, fast_path, include_hands=False)
+        with patch.object(reporter, 'orjson', None):
+            export_to_json(result, plain_path, include_hands=False)
+
+        with open(fast_path, 'r') as f:
+            fast_data = json.load(f)
+        with open(plain_path, 'r') as f:
+            plain_data = json.load(f)
+        self.assertEqual(fast_data, plain_data)
+
+
 class TestIntegrationWithSimulator(unittest.TestCase):
     """Integration tests with actual simulator runs."""
 
@@ -2,11 +2,27 @@
 Unit tests for simulator module.
 """
 
+import gc
+import random
+import statistics
 import unittest
-from src.simulator import Simulator, SessionResult, SimulationResult
+from src.simulator import Simulator, SessionResult, SimulationResult, mean_stdev
 from src.game import GameRules, PlayerAction
 from src.hand import Hand
 from src.cards import Card
+from src.betting import FlatBetting
+
+
+def always_stand(player_hand, dealer_upcard):
+    """Module-level strategy, shared by tests and picklable into worker processes."""
+    return PlayerAction.STAND
+
+
+def hit_to_17(player_hand, dealer_upcard):
+    """Module-level strategy so it can be pickled into worker processes."""
+    if player_hand.value() < 17:
+        return PlayerAction.HIT
+    return PlayerAction.STAND
 
 
 class TestSessionResult(unittest.TestCase):
@@ -55,6 +71,11 @@ class TestSimulationResult(unittest.TestCase):
         result = SimulationResult(total_hands=1000, total_payout=-50.0)
         self.assertEqual(result.ev_per_hand, -0.05)
 
+    def test_elapsed_seconds(self):
+        """Test elapsed seconds derived from integer nanoseconds."""
+        result = SimulationResult(elapsed_ns=2_500_000_000)
+        self.assertEqual(result.elapsed_seconds, 2.5)
+
     def test_win_rate(self):
         """Test overall win rate."""
         result = SimulationResult(win_count=450, loss_count=550, push_count=100)
@@ -86,6 +107,15 @@ class TestSimulationResult(unittest.TestCase):
         # Stdev should be 0 (only 1 session)
         self.assertEqual(result.session_ev_stdev, 0.0)
 
+    def test_mean_stdev_matches_statistics(self):
+        """Test one-pass mean/stdev against the statistics module."""
+        values = [-0.05, -0.03, -0.07, 0.12, -0.2, 0.0, 0.015]
+        mean, stdev = mean_stdev(values)
+        self.assertAlmostEqual(mean, statistics.mean(values), places=12)
+        self.assertAlmostEqual(stdev, statistics.stdev(values), places=12)
+        self.assertEqual(mean_stdev([]), (0.0, 0.0))
+        self.assertEqual(mean_stdev([0.25]), (0.25, 0.0))
+
     def test_summary_string(self):
         """Test summary generation."""
         result = SimulationResult(
@@ -141,6 +171,25 @@ class TestSimulator(unittest.TestCase):
         total_outcomes = session.win_count + session.loss_count + session.push_count
         self.assertEqual(total_outcomes, 100)
 
+    def test_simulate_batch(self):
+        """Test batch simulation returns one payout per hand."""
+        sim = Simulator(infinite_shoe=True)
+
+        payouts = sim.simulate_batch(200, always_stand)
+
+        self.assertEqual(len(payouts), 200)
+        for payout in payouts:
+            self.assertIn(payout, (-1.0, 0.0, 1.0, 1.5))
+
+    def test_run_session_flat_betting(self):
+        """Test that flat betting wagers its base unit on every hand."""
+        sim = Simulator(infinite_shoe=True)
+
+        session = sim.run_session(100, always_stand, betting_strategy=FlatBetting(base_unit=5.0))
+
+        self.assertEqual(session.total_wagered, 500.0)
+        self.assertEqual(session.hands_played, 100)
+
     def test_run_session_hit_strategy(self):
         """Test session with a hit-until-17 strategy."""
         sim = Simulator(infinite_shoe=True)
@@ -248,6 +297,49 @@ class TestSimulator(unittest.TestCase):
             places=4
         )
 
+    def test_run_simulation_without_retained_sessions(self):
+        """Test that folding sessions gives the same totals and EV statistics."""
+        sim = Simulator(infinite_shoe=True)
+
+        random.seed(7)
+        retained = sim.run_simulation(6000, always_stand, num_sessions=1500)
+        random.seed(7)
+        folded = sim.run_simulation(6000, always_stand, num_sessions=1500,
+                                    retain_sessions=False)
+
+        self.assertEqual(folded.sessions, [])
+        self.assertEqual(folded.session_count, 1500)
+        self.assertEqual(folded.total_hands, retained.total_hands)
+        self.assertEqual(folded.total_payout, retained.total_payout)
+        self.assertEqual(folded.win_count, retained.win_count)
+        self.assertEqual(folded.max_loss_streak, retained.max_loss_streak)
+        self.assertAlmostEqual(folded.session_ev_mean, retained.session_ev_mean, places=12)
+        self.assertAlmostEqual(folded.session_ev_stdev, retained.session_ev_stdev, places=12)
+
+        # Tracked hands live on the sessions, so they can't be folded away
+        with self.assertRaises(ValueError):
+            sim.run_simulation(100, always_stand, num_sessions=10,
+                               retain_sessions=False, track_hands=True)
+
+    def test_run_simulation_pause_gc(self):
+        """Test that GC is only paused when asked, and restored afterwards."""
+        sim = Simulator(infinite_shoe=True)
+        gc_states = []
+
+        def record_gc(player_hand, dealer_upcard):
+            gc_states.append(gc.isenabled())
+            return PlayerAction.STAND
+
+        self.assertTrue(gc.isenabled())
+        sim.run_simulation(20, record_gc)
+        self.assertTrue(gc_states)
+        self.assertTrue(all(gc_states))
+
+        gc_states.clear()
+        sim.run_simulation(20, record_gc, pause_gc=True)
+        self.assertFalse(any(gc_states))
+        self.assertTrue(gc.isenabled())
+
     def test_compare_strategies(self):
         """Test strategy comparison."""
         sim = Simulator(infinite_shoe=True)
@@ -282,6 +374,22 @@ class TestSimulator(unittest.TestCase):
             results['Hit to 17'].ev_per_hand
         )
 
+    def test_compare_strategies_parallel(self):
+        """Test strategy comparison in worker processes."""
+        sim = Simulator(infinite_shoe=True)
+
+        results = sim.compare_strategies(
+            strategy_funcs=[always_stand, hit_to_17],
+            strategy_names=['Always Stand', 'Hit to 17'],
+            hands_per_strategy=500,
+            max_workers=2
+        )
+
+        self.assertEqual(list(results), ['Always Stand', 'Hit to 17'])
+        self.assertEqual(results['Always Stand'].total_hands, 500)
+        self.assertEqual(results['Hit to 17'].total_hands, 500)
+        self.assertEqual(results['Always Stand'].bust_count, 0)
+
     def test_run_session_tracks_streaks(self):
         """Test that sessions track winning and losing streaks."""
         sim = Simulator(infinite_shoe=True)